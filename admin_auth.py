@@ -4,42 +4,222 @@ Provides password protection for admin panels across all systems
 """
 
 import streamlit as st
-from typing import Optional, Dict, Any
+from typing import Optional, Dict
 import hashlib
-from datetime import datetime, timedelta
+import hmac
+import logging
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import deque
+from functools import lru_cache, wraps
+
+_log = logging.getLogger(__name__)
+
+# Optional: bcrypt-hashed admin passwords in secrets
+try:
+    import bcrypt
+    BCRYPT_AVAILABLE = True
+except ImportError:
+    BCRYPT_AVAILABLE = False
+
+# Session id of the current script run, used to throttle clients that reach us without a proxy
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+except ImportError:
+    get_script_run_ctx = None
+
+# Shape of a bcrypt hash: $2b$<cost>$<22-char salt><31-char digest>
+_BCRYPT_HASH_RE = re.compile(rb"\$2[abxy]?\$\d{2}\$[./A-Za-z0-9]{53}")
+
+# Systems with admin panels and their session-state auth flags
+ADMIN_SYSTEMS = ('employee', 'foundation', 'payroll')
+_SESSION_KEYS = tuple(f'{system}_admin_authenticated' for system in ADMIN_SYSTEMS)
+_ACTIVE_COUNT_KEY = '_admin_active_count'
+
+def _refresh_active_count() -> int:
+    """Recount active admin sessions and cache the result in session state"""
+    ss = st.session_state
+    count = sum(1 for key in _SESSION_KEYS if ss.get(key, False))
+    ss[_ACTIVE_COUNT_KEY] = count
+    return count
+
+# Per-system display settings
+SYSTEM_DISPLAY_NAMES = {
+    'employee': 'Employee Data Management',
+    'foundation': 'Foundation Data Management', 
+    'payroll': 'Payroll Data Management'
+}
+
+SYSTEM_ICONS = {
+    'employee': '👥',
+    'foundation': '🏢',
+    'payroll': '💰'
+}
+
+SYSTEM_COLORS = {
+    'employee': 'linear-gradient(90deg, #1f2937 0%, #374151 100%)',
+    'foundation': 'linear-gradient(90deg, #059669 0%, #10b981 100%)',
+    'payroll': 'linear-gradient(90deg, #dc2626 0%, #ef4444 100%)'
+}
+
+DEFAULT_SYSTEM_ICON = '⚙️'
+DEFAULT_SYSTEM_COLOR = 'linear-gradient(90deg, #6b7280 0%, #9ca3af 100%)'
+
+@lru_cache(maxsize=None)
+def _system_display_name(system_name: str) -> str:
+    return SYSTEM_DISPLAY_NAMES.get(system_name, system_name.title())
+
+@lru_cache(maxsize=None)
+def _system_icon(system_name: str) -> str:
+    return SYSTEM_ICONS.get(system_name, DEFAULT_SYSTEM_ICON)
+
+@lru_cache(maxsize=None)
+def _system_color(system_name: str) -> str:
+    return SYSTEM_COLORS.get(system_name, DEFAULT_SYSTEM_COLOR)
+
+def _build_login_header_html(system_name: str) -> str:
+    """Build the login header HTML for a system"""
+    return f"""
+        <div style="background: {_system_color(system_name)}; 
+                    color: white; padding: 2rem; border-radius: 10px; margin-bottom: 2rem;">
+            <h1 style="margin: 0; font-size: 2.5rem;">{_system_icon(system_name)} Admin Access Required</h1>
+            <p style="margin: 0.5rem 0 0 0; font-size: 1.2rem; opacity: 0.9;">
+                Enter the admin password to access {_system_display_name(system_name)} Configuration Center
+            </p>
+        </div>
+        """
+
+# Login header and sidebar label HTML are fixed per system; build them once at import
+_LOGIN_HEADER_HTML = {system: _build_login_header_html(system) for system in ADMIN_SYSTEMS}
+_SIDEBAR_ADMIN_LABEL = {system: f"**🔐 {_system_display_name(system)} Admin**" for system in ADMIN_SYSTEMS}
+
+@st.cache_data(show_spinner=False)
+def _security_notice_markdown(system_display: str, password_key: str, bcrypt_key: str) -> str:
+    """Build the login screen security notice for a system"""
+    return f"""
+        **What this protects:** The {system_display} Configuration Center contains sensitive settings that control how your data is processed.
+        
+        **Why password protection:** 
+        - Prevents accidental changes to critical mappings and configurations
+        - Ensures only authorized users can modify system templates
+        - Protects configuration integrity and data processing rules
+        
+        **For Administrators:**
+        - Password can be configured in Streamlit secrets as `{password_key}`
+        - Prefer storing a bcrypt hash as `{bcrypt_key}` (requires the `bcrypt` package)
+        - Use a strong password in production environments
+        - Regularly review who has admin access
+        - Master admin password (`master_admin_password`) works for all systems
+        """
+
+def _first_secret(*keys: str) -> Optional[str]:
+    """Return the first configured value among the given secrets keys"""
+    try:
+        store = st.secrets
+        for key in keys:
+            value = store.get(key)
+            if value:
+                return value
+    except Exception:
+        # No secrets file or unreadable secrets: behave as if nothing is configured
+        pass
+    return None
+
+def _resolve_password(key: str, default: str) -> str:
+    """Resolve a system password from secrets, falling back to the master password"""
+    return _first_secret(key, "master_admin_password") or default
+
+# Failed-login throttling, shared across sessions: client key -> failure timestamps
+LOGIN_FAILURE_LIMIT = 10
+LOGIN_FAILURE_WINDOW = 60  # seconds
+_FAILURE_PRUNE_INTERVAL = 300  # seconds
+_login_failures: Dict[str, deque] = {}
+_last_failure_prune = 0.0
+# Sessions run on separate threads; guards _login_failures and _last_failure_prune
+_login_failures_lock = threading.Lock()
+
+def _check_rate(key: str, limit: int = LOGIN_FAILURE_LIMIT, window: int = LOGIN_FAILURE_WINDOW) -> bool:
+    """Return True if the client may attempt another login"""
+    global _last_failure_prune
+    now = time.monotonic()
+    
+    with _login_failures_lock:
+        # Periodically drop clients with no recent failures to bound memory
+        if now - _last_failure_prune > _FAILURE_PRUNE_INTERVAL:
+            for stale in [k for k, d in _login_failures.items() if not d or d[-1] < now - window]:
+                _login_failures.pop(stale, None)
+            _last_failure_prune = now
+        
+        failures = _login_failures.get(key)
+        if not failures:
+            return True
+        while failures and failures[0] < now - window:
+            failures.popleft()
+        return len(failures) < limit
+
+def _record_failure(key: str) -> None:
+    """Record a failed login attempt for the client"""
+    with _login_failures_lock:
+        _login_failures.setdefault(key, deque()).append(time.monotonic())
 
 class AdminAuth:
     """Handles admin authentication for different system modules"""
     
+    __slots__ = (
+        "system_name", "default_password", "session_key", "password_key", "bcrypt_key",
+        "_cached_password", "_k_form", "_k_pw", "_k_status", "_k_logout", "_logout_label",
+        "_salt", "_bcrypt_hash", "_pw_hash",
+    )
+    
     def __init__(self, system_name: str, default_password: str = "admin123"):
         self.system_name = system_name.lower()
         self.default_password = default_password
         self.session_key = f'{self.system_name}_admin_authenticated'
         self.password_key = f'{self.system_name}_admin_password'
+        self.bcrypt_key = f'{self.system_name}_admin_bcrypt'
+        self._cached_password: Optional[str] = None
+        
+        # Widget keys are fixed for the life of the instance
+        self._k_form = sys.intern(f'{self.system_name}_login_form')
+        self._k_pw = sys.intern(f'{self.system_name}_password_input')
+        self._k_status = sys.intern(f'{self.system_name}_login_status')
+        self._k_logout = sys.intern(f'{self.system_name}_logout_btn')
+        self._logout_label = f"🚪 **Logout from {self.system_name.title()}**"
+        
+        self._salt = secrets.token_bytes(16)
+        self._load_credentials()
+    
+    def _load_credentials(self) -> None:
+        """Read the configured credentials from secrets once per instance"""
+        # Prefer a bcrypt hash from secrets
+        self._bcrypt_hash = self.get_password_hash() if BCRYPT_AVAILABLE else None
+        if self._bcrypt_hash and not _BCRYPT_HASH_RE.fullmatch(self._bcrypt_hash):
+            # A malformed hash (e.g. the secrets.toml placeholder) would make every login raise
+            _log.warning("Ignoring malformed bcrypt hash for %s admin; using the password secret instead", self.system_name)
+            self._bcrypt_hash = None
+        
+        # Legacy plaintext secret: hash it once so logins never compare plaintext
+        self._pw_hash = None if self._bcrypt_hash else self._hash(self.get_password().encode("utf-8"))
+    
+    def invalidate_password_cache(self) -> None:
+        """Re-read credentials from secrets, e.g. after a password rotation"""
+        self._cached_password = None
+        self._load_credentials()
         
     def get_system_display_name(self) -> str:
         """Get formatted system name for display"""
-        return {
-            'employee': 'Employee Data Management',
-            'foundation': 'Foundation Data Management', 
-            'payroll': 'Payroll Data Management'
-        }.get(self.system_name, self.system_name.title())
+        return _system_display_name(self.system_name)
     
     def get_system_icon(self) -> str:
         """Get icon for the system"""
-        return {
-            'employee': '👥',
-            'foundation': '🏢',
-            'payroll': '💰'
-        }.get(self.system_name, '⚙️')
+        return _system_icon(self.system_name)
     
     def get_system_color(self) -> str:
         """Get color scheme for the system"""
-        return {
-            'employee': 'linear-gradient(90deg, #1f2937 0%, #374151 100%)',
-            'foundation': 'linear-gradient(90deg, #059669 0%, #10b981 100%)',
-            'payroll': 'linear-gradient(90deg, #dc2626 0%, #ef4444 100%)'
-        }.get(self.system_name, 'linear-gradient(90deg, #6b7280 0%, #9ca3af 100%)')
+        return _system_color(self.system_name)
     
     def is_authenticated(self) -> bool:
         """Check if user is currently authenticated"""
@@ -47,106 +227,145 @@ class AdminAuth:
     
     def get_password(self) -> str:
         """Get the correct password from secrets or use default"""
-        try:
-            # Try to get from Streamlit secrets
-            return st.secrets.get(self.password_key, self.default_password)
-        except:
-            # Try master admin password as fallback
+        if self._cached_password is None:
+            self._cached_password = _resolve_password(self.password_key, self.default_password)
+        return self._cached_password
+    
+    def get_password_hash(self) -> Optional[bytes]:
+        """Get the bcrypt password hash from secrets, if configured"""
+        stored = _first_secret(self.bcrypt_key, "master_admin_bcrypt")
+        return stored.encode() if stored else None
+    
+    def _hash(self, password_bytes: bytes) -> bytes:
+        """Hash an encoded password with this instance's salt"""
+        return hashlib.sha256(self._salt + password_bytes).digest()
+    
+    def _verify(self, password_bytes: bytes) -> bool:
+        """Check an encoded password against the configured credentials"""
+        if self._bcrypt_hash:
             try:
-                return st.secrets.get("master_admin_password", self.default_password)
-            except:
-                return self.default_password
+                return bcrypt.checkpw(password_bytes, self._bcrypt_hash)
+            except ValueError:
+                # Invalid hash, or a password bcrypt refuses (over 72 bytes): a failed login
+                return False
+        return hmac.compare_digest(self._hash(password_bytes), self._pw_hash)
+    
+    def _client_key(self) -> str:
+        """Identify the client for login throttling"""
+        try:
+            forwarded = st.context.headers.get("x-forwarded-for", "")
+        except AttributeError:
+            # st.context is only available on newer Streamlit versions
+            forwarded = ""
+        # Earlier hops are client-supplied; only the one appended by our proxy can be trusted
+        client = forwarded.rsplit(",", 1)[-1].strip()
+        if not client:
+            # No proxy header: fall back to the browser session instead of one key shared by everyone
+            ctx = get_script_run_ctx() if get_script_run_ctx else None
+            client = ctx.session_id if ctx is not None else "local"
+        return f"{client}:{self.system_name}"
+    
+    def is_locked_out(self) -> bool:
+        """Check if too many failed logins came from this client recently"""
+        return not _check_rate(self._client_key())
     
     def authenticate(self, password: str) -> bool:
         """Authenticate with provided password"""
-        correct_password = self.get_password()
+        client_key = self._client_key()
+        if not _check_rate(client_key):
+            return False
         
-        if password == correct_password:
+        if self._verify(password.encode("utf-8", "ignore")):
             st.session_state[self.session_key] = True
+            _refresh_active_count()
             return True
+        
+        _record_failure(client_key)
         return False
     
     def logout(self) -> None:
         """Logout the current user"""
-        st.session_state[self.session_key] = False
+        # Drop the keys entirely; is_authenticated() treats a missing key as False
+        st.session_state.pop(self.session_key, None)
+        st.session_state.pop(self._k_pw, None)
+        _refresh_active_count()
     
     def show_login_screen(self) -> bool:
         """Show login screen and handle authentication"""
-        if self.is_authenticated():
+        if st.session_state.get(self.session_key):
             return True
-        
-        system_display = self.get_system_display_name()
-        system_icon = self.get_system_icon()
-        system_color = self.get_system_color()
-        
+        return self._render_login()
+    
+    def _render_login(self) -> bool:
+        """Render the login UI (caller has checked authentication)"""
         # Show login header
-        st.markdown(f"""
-        <div style="background: {system_color}; 
-                    color: white; padding: 2rem; border-radius: 10px; margin-bottom: 2rem;">
-            <h1 style="margin: 0; font-size: 2.5rem;">{system_icon} Admin Access Required</h1>
-            <p style="margin: 0.5rem 0 0 0; font-size: 1.2rem; opacity: 0.9;">
-                Enter the admin password to access {system_display} Configuration Center
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Password input
-        password_input = st.text_input(
-            "🔑 **Admin Password:**",
-            type="password",
-            placeholder="Enter admin password...",
-            help="Contact your system administrator if you don't have the password",
-            key=f"{self.system_name}_password_input"
-        )
-        
-        col1, col2, col3 = st.columns([1, 1, 2])
-        
-        with col1:
-            if st.button("🔓 **Access Admin**", type="primary", key=f"{self.system_name}_login"):
-                if self.authenticate(password_input):
-                    st.success("✅ Access granted! Refreshing...")
-                    st.rerun()
-                else:
-                    st.error("❌ Invalid password")
-                    st.warning("Please check your password and try again")
+        header_html = _LOGIN_HEADER_HTML.get(self.system_name) or _build_login_header_html(self.system_name)
+        st.markdown(header_html, unsafe_allow_html=True)
         
-        with col2:
-            if st.button("🔄 **Clear**", key=f"{self.system_name}_clear"):
-                st.rerun()
+        # Login form: typing in the password field doesn't rerun the script, only submitting does
+        with st.form(key=self._k_form, clear_on_submit=False):
+            st.text_input(
+                "🔑 **Admin Password:**",
+                type="password",
+                placeholder="Enter admin password...",
+                help="Contact your system administrator if you don't have the password",
+                key=self._k_pw
+            )
+            
+            col1, col2, col3 = st.columns([1, 1, 2])
+            
+            # Submissions are handled in callbacks, which run before the rerun the
+            # form triggers anyway, so a successful login renders the admin page directly
+            with col1:
+                st.form_submit_button("🔓 **Access Admin**", type="primary", on_click=self._on_login_submit)
+            
+            with col2:
+                st.form_submit_button("🔄 **Clear**", on_click=self._on_clear_submit)
+            
+            with col3:
+                st.info(f"💡 **Default password:** {self.default_password} (if not configured)")
         
-        with col3:
-            st.info(f"💡 **Default password:** {self.default_password} (if not configured)")
+        status = st.session_state.pop(self._k_status, None)
+        if status == "locked":
+            st.error("❌ Too many failed attempts")
+            st.warning(f"Please wait {LOGIN_FAILURE_WINDOW} seconds and try again")
+        elif status == "invalid":
+            st.error("❌ Invalid password")
+            st.warning("Please check your password and try again")
         
-        # Security notice
+        # Security notice (collapsed so it only renders on demand)
         st.markdown("---")
-        st.markdown(f"""
-        ### 🛡️ Security Notice
-        
-        **What this protects:** The {system_display} Configuration Center contains sensitive settings that control how your data is processed.
-        
-        **Why password protection:** 
-        - Prevents accidental changes to critical mappings and configurations
-        - Ensures only authorized users can modify system templates
-        - Protects configuration integrity and data processing rules
-        
-        **For Administrators:**
-        - Password can be configured in Streamlit secrets as `{self.password_key}`
-        - Use a strong password in production environments
-        - Regularly review who has admin access
-        - Master admin password (`master_admin_password`) works for all systems
-        """)
+        with st.expander("🛡️ Security Notice", expanded=False):
+            st.markdown(_security_notice_markdown(
+                self.get_system_display_name(), self.password_key, self.bcrypt_key
+            ))
         
         return False
     
+    def _on_login_submit(self) -> None:
+        """Form callback: authenticate with the submitted password"""
+        if self.authenticate(st.session_state.get(self._k_pw, "")):
+            st.session_state.pop(self._k_pw, None)
+        else:
+            st.session_state[self._k_status] = "locked" if self.is_locked_out() else "invalid"
+    
+    def _on_clear_submit(self) -> None:
+        """Form callback: clear the password field"""
+        st.session_state[self._k_pw] = ""
+    
     def show_logout_sidebar(self) -> None:
         """Show logout option in sidebar for authenticated users"""
-        if not self.is_authenticated():
-            return
-            
+        if st.session_state.get(self.session_key):
+            self._render_logout_sidebar()
+    
+    def _render_logout_sidebar(self) -> None:
+        """Render the sidebar logout controls (caller has checked authentication)"""
         st.sidebar.markdown("---")
-        st.sidebar.markdown(f"**🔐 {self.get_system_display_name()} Admin**")
+        st.sidebar.markdown(
+            _SIDEBAR_ADMIN_LABEL.get(self.system_name) or f"**🔐 {self.get_system_display_name()} Admin**"
+        )
         
-        if st.sidebar.button(f"🚪 **Logout from {self.system_name.title()}**", help="Exit admin mode"):
+        if st.sidebar.button(self._logout_label, help="Exit admin mode", key=self._k_logout):
             self.logout()
             st.success("✅ Logged out successfully")
             st.rerun()
@@ -156,97 +375,96 @@ class AdminAuth:
         st.sidebar.caption("⚠️ Be careful with configuration changes")
     
     def require_auth(self, admin_function):
-        """Decorator-like function to require authentication for admin functions"""
-        if not self.show_login_screen():
-            return  # Exit if not authenticated
-        
-        # Show logout option
-        self.show_logout_sidebar()
+        """Decorator that shows the login screen until authenticated, then runs admin_function"""
+        @wraps(admin_function)
+        def wrapper(*args, **kwargs):
+            if not st.session_state.get(self.session_key):
+                self._render_login()
+                return None
+            
+            # Show logout option, then the actual admin function
+            self._render_logout_sidebar()
+            return admin_function(*args, **kwargs)
         
-        # Call the actual admin function
-        admin_function()
+        return wrapper
+
+# Shared admin auth instances; session state is per user, so one per system is enough
+_EMPLOYEE_AUTH = AdminAuth("employee", "admin123")
+_FOUNDATION_AUTH = AdminAuth("foundation", "admin123")
+_PAYROLL_AUTH = AdminAuth("payroll", "admin123")
 
 # Helper functions for quick setup
 def create_employee_admin() -> AdminAuth:
-    """Create admin auth for employee system"""
-    return AdminAuth("employee", "admin123")
+    """Get admin auth for employee system"""
+    return _EMPLOYEE_AUTH
 
 def create_foundation_admin() -> AdminAuth:
-    """Create admin auth for foundation system"""  
-    return AdminAuth("foundation", "admin123")
+    """Get admin auth for foundation system"""  
+    return _FOUNDATION_AUTH
 
 def create_payroll_admin() -> AdminAuth:
-    """Create admin auth for payroll system"""
-    return AdminAuth("payroll", "admin123")
+    """Get admin auth for payroll system"""
+    return _PAYROLL_AUTH
 
 # Example usage functions
+@_EMPLOYEE_AUTH.require_auth
 def protected_employee_admin():
     """Example of how to use admin protection for employee system"""
-    auth = create_employee_admin()
-    
-    def employee_admin_content():
-        st.markdown("### Employee Admin Content")
-        st.write("This is the protected employee admin area")
-        # Your actual employee admin code goes here
-    
-    auth.require_auth(employee_admin_content)
+    st.markdown("### Employee Admin Content")
+    st.write("This is the protected employee admin area")
+    # Your actual employee admin code goes here
 
+@_FOUNDATION_AUTH.require_auth
 def protected_foundation_admin():
     """Example of how to use admin protection for foundation system"""
-    auth = create_foundation_admin()
-    
-    def foundation_admin_content():
-        st.markdown("### Foundation Admin Content")
-        st.write("This is the protected foundation admin area")
-        # Your actual foundation admin code goes here
-    
-    auth.require_auth(foundation_admin_content)
+    st.markdown("### Foundation Admin Content")
+    st.write("This is the protected foundation admin area")
+    # Your actual foundation admin code goes here
 
+@_PAYROLL_AUTH.require_auth
 def protected_payroll_admin():
     """Example of how to use admin protection for payroll system"""
-    auth = create_payroll_admin()
+    st.markdown("### Payroll Admin Content") 
+    st.write("This is the protected payroll admin area")
+    # Your actual payroll admin code goes here
+
+# Advanced features: admin sessions across multiple systems
+def get_active_admin_sessions() -> Dict[str, bool]:
+    """Get all active admin sessions"""
+    ss = st.session_state
+    return {system: ss.get(key, False) for system, key in zip(ADMIN_SYSTEMS, _SESSION_KEYS)}
+
+def logout_all_systems() -> None:
+    """Logout from all admin systems"""
+    ss = st.session_state
+    for key in _SESSION_KEYS:
+        ss.pop(key, None)
+    ss[_ACTIVE_COUNT_KEY] = 0
+
+def show_session_status() -> None:
+    """Show status of all admin sessions in sidebar"""
+    active_count = st.session_state.get(_ACTIVE_COUNT_KEY)
+    if active_count is None:
+        active_count = _refresh_active_count()
+    if active_count == 0:
+        return
+    
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("**🔐 Active Admin Sessions**")
     
-    def payroll_admin_content():
-        st.markdown("### Payroll Admin Content") 
-        st.write("This is the protected payroll admin area")
-        # Your actual payroll admin code goes here
+    for system, is_active in get_active_admin_sessions().items():
+        icon = "🟢" if is_active else "⚪"
+        st.sidebar.caption(f"{icon} {system.title()}")
     
-    auth.require_auth(payroll_admin_content)
+    if active_count > 1:
+        if st.sidebar.button("🚪 **Logout All Systems**"):
+            logout_all_systems()
+            st.success("✅ Logged out from all systems")
+            st.rerun()
 
-# Advanced features
 class SessionManager:
-    """Manage admin sessions across multiple systems"""
-    
-    @staticmethod
-    def get_active_admin_sessions() -> Dict[str, bool]:
-        """Get all active admin sessions"""
-        sessions = {}
-        for system in ['employee', 'foundation', 'payroll']:
-            sessions[system] = st.session_state.get(f'{system}_admin_authenticated', False)
-        return sessions
-    
-    @staticmethod
-    def logout_all_systems() -> None:
-        """Logout from all admin systems"""
-        for system in ['employee', 'foundation', 'payroll']:
-            st.session_state[f'{system}_admin_authenticated'] = False
-    
-    @staticmethod
-    def show_session_status() -> None:
-        """Show status of all admin sessions in sidebar"""
-        sessions = SessionManager.get_active_admin_sessions()
-        active_count = sum(sessions.values())
-        
-        if active_count > 0:
-            st.sidebar.markdown("---")
-            st.sidebar.markdown("**🔐 Active Admin Sessions**")
-            
-            for system, is_active in sessions.items():
-                icon = "🟢" if is_active else "⚪"
-                st.sidebar.caption(f"{icon} {system.title()}")
-            
-            if active_count > 1:
-                if st.sidebar.button("🚪 **Logout All Systems**"):
-                    SessionManager.logout_all_systems()
-                    st.success("✅ Logged out from all systems")
-                    st.rerun()
+    """Manage admin sessions across multiple systems (kept for backward compatibility)"""
+    
+    get_active_admin_sessions = staticmethod(get_active_admin_sessions)
+    logout_all_systems = staticmethod(logout_all_systems)
+    show_session_status = staticmethod(show_session_status)
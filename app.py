@@ -1,22 +1,19 @@
 import os, sys
+import importlib.util
 import streamlit as st
 import base64
 from streamlit_option_menu import option_menu
-from employee_app import render_employee_tool
 
-# Import the foundation data management wrapper
-try:
-    from foundation_data_wrapper import render_foundation_data_management, get_foundation_system_status
-    FOUNDATION_WRAPPER_AVAILABLE = True
-except ImportError as e:
-    FOUNDATION_WRAPPER_AVAILABLE = False
-    print(f"Foundation wrapper not available: {e}")
-    # Fallback to old foundation system
-    try:
-        from foundation_module.foundation_app import render as render_foundation
-        OLD_FOUNDATION_AVAILABLE = True
-    except ImportError:
-        OLD_FOUNDATION_AVAILABLE = False
+# Make sibling modules importable; the check keeps reruns from growing sys.path
+APP_DIR = os.path.abspath(os.path.dirname(__file__))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+# The foundation data management wrapper is imported only when its page is shown,
+# so the home page never pays for it; here we only check that it is there
+FOUNDATION_WRAPPER_AVAILABLE = importlib.util.find_spec("foundation_data_wrapper") is not None
+if not FOUNDATION_WRAPPER_AVAILABLE:
+    print("Foundation wrapper not available")
 
 # Import the employee data management wrapper
 try:
@@ -33,33 +30,23 @@ try:
 except ImportError as e:
     PAYROLL_WRAPPER_AVAILABLE = False
     print(f"Payroll wrapper not available: {e}")
-    # Fallback to old payroll system
-    try:
-        from payroll import app as payroll_app
-        OLD_PAYROLL_AVAILABLE = True
-    except ImportError:
-        OLD_PAYROLL_AVAILABLE = False
-
-# Hide Streamlit style (footer and hamburger menu)
-st.markdown("""
-    <style>
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    </style>
-""", unsafe_allow_html=True)
 
 if "page" not in st.session_state:
     st.session_state.page = "Home"
 
-sys.path.append(os.path.abspath(os.path.dirname(__file__)))
-
 # ✅ Page setup
 st.set_page_config(layout="wide", page_title="MVS", page_icon="📊")
 
-# 👇 Force sidebar collapse control to always show
-st.markdown("""
+# ✅ Static CSS, emitted in a single markdown call:
+# hidden Streamlit chrome, sidebar toggle, light/dark mode fix, banner and layout spacing
+STATIC_CSS = """
 <style>
+/* Hide Streamlit style (footer and hamburger menu) */
+#MainMenu {visibility: hidden;}
+footer {visibility: hidden;}
+header {visibility: hidden;}
+
+/* Force sidebar collapse control to always show */
 [data-testid="collapsedControl"] {
     display: block !important;
     visibility: visible !important;
@@ -70,12 +57,7 @@ st.markdown("""
     left: 1.5rem !important;
     z-index: 9999 !important;
 }
-</style>
-""", unsafe_allow_html=True)
 
-# ✅ CSS styling (light/dark mode fix + banner)
-st.markdown("""
-<style>
 html, body, [class*="st-"], [class*="css"] {
     color: inherit !important;
 }
@@ -113,26 +95,52 @@ section.main > div, .block-container {
     font-weight: 400;
 }
 
-/* Force sidebar toggle button to always be visible */
-[data-testid="collapsedControl"] {
-    display: block !important;
-    visibility: visible !important;
-    opacity: 1 !important;
-    pointer-events: all !important;
-}
-
 /* Default background gradient if image not available */
 .stApp {
     background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
     background-attachment: fixed;
 }
+
+/* Remove top white space */
+.block-container {
+    padding-top: 0.5rem !important;
+}
+@media (max-width: 768px) {
+    .block-container {
+        padding-left: 1rem;
+        padding-right: 1rem;
+    }
+}
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(STATIC_CSS, unsafe_allow_html=True)
+
+# ✅ Cached base64 encoding so images are read once per process, not on every rerun
+@st.cache_data(show_spinner=False)
+def encode_image(image_path):
+    """Read an image file and return it base64-encoded"""
+    with open(image_path, "rb") as f:
+        return base64.b64encode(f.read()).decode()
 
 # ✅ Background image setup with error handling and multiple path support
 def set_background(image_file):
     """Set background image with graceful fallback"""
-    # Try multiple possible locations
+    # Prefer Streamlit static serving: the browser fetches and caches the file once
+    if os.path.exists(os.path.join(APP_DIR, "static", image_file)):
+        st.markdown(f"""
+            <style>
+                .stApp {{
+                    background: linear-gradient(rgba(255,255,255,0.85), rgba(255,255,255,0.85)),
+                                url("app/static/{image_file}");
+                    background-size: cover;
+                    background-attachment: fixed;
+                    background-position: center;
+                }}
+            </style>
+        """, unsafe_allow_html=True)
+        return
+    
+    # Otherwise inline it from one of the image folders
     possible_paths = [
         image_file,
         f"images_1/{image_file}",
@@ -142,8 +150,7 @@ def set_background(image_file):
     for image_path in possible_paths:
         try:
             if os.path.exists(image_path):
-                with open(image_path, "rb") as f:
-                    data = base64.b64encode(f.read()).decode()
+                data = encode_image(image_path)
                 st.markdown(f"""
                     <style>
                         .stApp {{
@@ -179,41 +186,28 @@ if "demo_page" not in st.session_state:
     st.session_state.demo_page = "main"
 
 # ✅ Sidebar navigation
+SIDEBAR_MENU_STYLES = {
+    "container": {"padding": "5px", "background-color": "#f8f9fa"},
+    "icon": {"color": "#003366", "font-size": "18px"},
+    "nav-link": {
+        "font-size": "16px",
+        "text-align": "left",
+        "margin": "5px",
+        "--hover-color": "#e6f0ff",
+    },
+    "nav-link-selected": {"background-color": "#cfe2ff", "font-weight": "bold"},
+}
+
 with st.sidebar:
     selected = option_menu(
         menu_title="Navigation",
         options=["Home", "Solutions", "Launch Demo"],
         icons=["house", "layers", "rocket"],
         default_index=0,
-        styles={
-            "container": {"padding": "5px", "background-color": "#f8f9fa"},
-            "icon": {"color": "#003366", "font-size": "18px"},
-            "nav-link": {
-                "font-size": "16px",
-                "text-align": "left",
-                "margin": "5px",
-                "--hover-color": "#e6f0ff",
-            },
-            "nav-link-selected": {"background-color": "#cfe2ff", "font-weight": "bold"},
-        },
+        styles=SIDEBAR_MENU_STYLES,
     )
     st.session_state.selected = selected
 
-# ✅ Remove top white space
-st.markdown("""
-<style>
-    .block-container {
-        padding-top: 0.5rem !important;
-    }
-    @media (max-width: 768px) {
-        .block-container {
-            padding-left: 1rem;
-            padding-right: 1rem;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
-
 # Helper function to display images with fallback and multiple path support
 def display_image(image_path, alt_text="Image", **kwargs):
     """Display image with fallback to placeholder if not found"""
@@ -235,51 +229,131 @@ def display_image(image_path, alt_text="Image", **kwargs):
     # If no image found, show placeholder
     st.info(f"📷 {alt_text}")
 
-# -------------------- HOME --------------------
-if selected == "Home":
-    st.markdown("""
-        <style>
-        .full-width-banner {
-            position: relative;
-            left: 50%;
-            right: 50%;
-            margin-left: -50vw;
-            margin-right: -50vw;
-            width: 100vw;
-            background-color: #e6f0ff;
-            padding: 2rem 0;
-            text-align: center;
-            font-size: 1.8rem;
-            font-weight: bold;
-            border-radius: 0;
-        }
-        </style>
+# Static HTML blocks, rendered with st.html to skip the markdown pipeline
+HOME_BANNER_HTML = """
+<style>
+.full-width-banner {
+    position: relative;
+    left: 50%;
+    right: 50%;
+    margin-left: -50vw;
+    margin-right: -50vw;
+    width: 100vw;
+    background-color: #e6f0ff;
+    padding: 2rem 0;
+    text-align: center;
+    font-size: 1.8rem;
+    font-weight: bold;
+    border-radius: 0;
+}
+</style>
 
-        <div class="full-width-banner">
-            Effortless Data Migration, Done Right<br>
-            <span style="font-size: 1.4rem; font-weight: normal;">MVS (Migration & Validation Suite)</span>
+<div class="full-width-banner">
+    Effortless Data Migration, Done Right<br>
+    <span style="font-size: 1.4rem; font-weight: normal;">MVS (Migration & Validation Suite)</span>
+</div>
+"""
+
+HOME_INTRO_HTML = """
+<h3>Enable secure, scalable, and audit-ready HR data migration across SAP landscapes</h3>
+<p>Supports Migration for SAP HCM (on-premise and cloud), SAP S/4HANA, and legacy HR systems.</p>
+<p><strong>Power your transformation with:</strong></p>
+<ul>
+    <li><strong>Schema Mapping & Transformation</strong><br>
+        Seamlessly aligns and converts source structures into SAP-ready formats across platforms.</li>
+    <li><strong>Pre-Migration Validation</strong><br>
+        Identifies data issues early on through audit trials for cloud and S/4HANA adoption.</li>
+    <li><strong>Rollback & Audit-Ready Tracking</strong><br>
+        Enables safe, reversible data loads with full traceability of rules, configurations, and actions.</li>
+</ul>
+<p><strong>Supported Migration Paths:</strong></p>
+<ul>
+    <li>SAP HCM → SuccessFactors</li>
+    <li>SAP HCM → S/4HANA</li>
+    <li>Legacy HR Systems → SAP Cloud or On-Premise</li>
+</ul>
+"""
+
+WHY_MVS_HTML = """
+<h3>Why MVS?</h3>
+<p>MVS is a robust solution for orchestrating HR data migration across hybrid environments, including SAP On-Premise, S/4HANA, SuccessFactors, and legacy systems.</p>
+"""
+
+KEY_CAPABILITIES_HTML = """
+<ul>
+    <li>AI-powered mapping & validation</li>
+    <li>Real-time preview & profiling</li>
+    <li>Cross-object and row-level validation</li>
+    <li>Licensing controls & role-based access</li>
+    <li>Audit logs, rollback & monitoring</li>
+    <li>Designed to reduce manual effort and shorten project timelines</li>
+    <li>Supports stakeholder collaboration with clear audit and status visibility</li>
+    <li>Ability to easily create and manage transformation rules with an intuitive, interactive interface</li>
+</ul>
+"""
+
+SAP_PLATFORM_HTML = """
+<div style='background-color:#002b5c;padding:40px;margin-top:50px;border-radius:10px;'>
+    <h3 style='color:white;text-align:center;'>Built for SAP Cloud & On-Premise</h3>
+    <p style='color:white;text-align:center;'>Our platform is designed to simplify, safeguard, and speed up your transformation journey.</p>
+    <div style='display:flex;justify-content:space-around;margin-top:30px;'>
+        <div style='width:30%;text-align:center;'>
+            <h4 style='color:white;'>Data Migration Made Easy</h4>
+            <p style='color:white;'>Supports smooth data preparation and migration for SAP environments.</p>
         </div>
-    """, unsafe_allow_html=True)
+        <div style='width:30%;text-align:center;'>
+            <h4 style='color:white;'>Data Integrity & Compliance</h4>
+            <p style='color:white;'>Field-level validation ensures readiness for audits and continuity.</p>
+        </div>
+        <div style='width:30%;text-align:center;'>
+            <h4 style='color:white;'>Document-Ready Migrations</h4>
+            <p style='color:white;'>Generate structured output files ready for upload and compliance.</p>
+        </div>
+    </div>
+</div>
+"""
+
+LAUNCH_PAD_HEADER_HTML = """
+<div style='background-color:#e6f0ff;padding:20px;border-radius:10px;margin-bottom:20px;'>
+    <h2 style='text-align:center;'>🚀 Launch Pad</h2>
+    <h4 style='text-align:center;'>Select a migration scenario to get started</h4>
+</div>
+"""
+
+FEATURE_ROWS = [
+    ("data_icon.png", "Template-driven, secure transfers between systems."),
+    ("check_icon.png", "Detailed checks at the field level to catch issues throughout the migration process."),
+    ("chart_icon.png", "Automated comparisons between source and target systems."),
+]
+
+@st.cache_data(show_spinner=False)
+def build_feature_rows_html():
+    """Build the "Why MVS?" icon rows as one HTML table (icons looked up and encoded once)"""
+    rows = []
+    for icon, desc in FEATURE_ROWS:
+        # Try multiple paths for icons, fall back to an emoji
+        icon_html = "📊"
+        for icon_path in [icon, f"images_1/{icon}", f"images_2/{icon}"]:
+            try:
+                if os.path.exists(icon_path):
+                    img_data = encode_image(icon_path)
+                    icon_html = f"""<img src="data:image/png;base64,{img_data}" width="40" style="margin-top:10px;">"""
+                    break
+            except Exception:
+                continue
+        rows.append(
+            f"<tr><td style='width:60px;vertical-align:top;border:none;'>{icon_html}</td>"
+            f"<td style='border:none;'><p style='margin-top:18px;'>{desc}</p></td></tr>"
+        )
+    return f"<table style='border:none;border-collapse:collapse;'>{''.join(rows)}</table>"
+
+# -------------------- HOME --------------------
+if selected == "Home":
+    st.html(HOME_BANNER_HTML)
 
     col1, col2 = st.columns([3, 2.5])
     with col1:
-        st.markdown("### Enable secure, scalable, and audit-ready HR data migration across SAP landscapes")
-        st.markdown("Supports Migration for SAP HCM (on-premise and cloud), SAP S/4HANA, and legacy HR systems.")
-        st.markdown("**Power your transformation with:**")
-        st.markdown("""
-        - **Schema Mapping & Transformation**  
-          Seamlessly aligns and converts source structures into SAP-ready formats across platforms.
-        - **Pre-Migration Validation**  
-          Identifies data issues early on through audit trials for cloud and S/4HANA adoption.
-        - **Rollback & Audit-Ready Tracking**  
-          Enables safe, reversible data loads with full traceability of rules, configurations, and actions.
-        """)
-        st.markdown("**Supported Migration Paths:**")
-        st.markdown("""
-        - SAP HCM → SuccessFactors  
-        - SAP HCM → S/4HANA  
-        - Legacy HR Systems → SAP Cloud or On-Premise
-        """)
+        st.html(HOME_INTRO_HTML)
 
     with col2:
         display_image("pexels-divinetechygirl-1181263.jpg", "Data Migration Illustration", use_container_width=True)
@@ -292,88 +366,18 @@ if selected == "Home":
 
     col1, col2 = st.columns([3, 2.5])
     with col1:
-        st.markdown("### Why MVS?")
-        st.markdown("""
-        <p>MVS is a robust solution for orchestrating HR data migration across hybrid environments, including SAP On-Premise, S/4HANA, SuccessFactors, and legacy systems.</p>
-        """, unsafe_allow_html=True)
-
-        icons = ["data_icon.png", "check_icon.png", "chart_icon.png"]
-        descriptions = [
-            "Template-driven, secure transfers between systems.",
-            "Detailed checks at the field level to catch issues throughout the migration process.",
-            "Automated comparisons between source and target systems."
-        ]
-
-        for icon, desc in zip(icons, descriptions):
-            icon_col, text_col = st.columns([1, 6])
-            with icon_col:
-                # Try multiple paths for icons
-                icon_found = False
-                for icon_path in [icon, f"images_1/{icon}", f"images_2/{icon}"]:
-                    try:
-                        if os.path.exists(icon_path):
-                            with open(icon_path, "rb") as f:
-                                img_data = base64.b64encode(f.read()).decode()
-                            st.markdown(
-                                f"""<img src="data:image/png;base64,{img_data}" width="40" style="margin-top:10px;">""",
-                                unsafe_allow_html=True
-                            )
-                            icon_found = True
-                            break
-                    except:
-                        continue
-                
-                if not icon_found:
-                    st.markdown("📊", unsafe_allow_html=True)  # Fallback emoji
-                    
-            with text_col:
-                st.markdown(f"<p style='margin-top:18px;'>{desc}</p>", unsafe_allow_html=True)
+        st.html(WHY_MVS_HTML + build_feature_rows_html())
 
     with col2:
         st.markdown("#### Key Capabilities:")
-        st.markdown("""
-        <ul>
-            <li>AI-powered mapping & validation</li>
-            <li>Real-time preview & profiling</li>
-            <li>Cross-object and row-level validation</li>
-            <li>Licensing controls & role-based access</li>
-            <li>Audit logs, rollback & monitoring</li>
-            <li>Designed to reduce manual effort and shorten project timelines</li>
-            <li>Supports stakeholder collaboration with clear audit and status visibility</li>
-            <li>Ability to easily create and manage transformation rules with an intuitive, interactive interface</li>
-        </ul>
-        """, unsafe_allow_html=True)
+        st.html(KEY_CAPABILITIES_HTML)
 
-    st.markdown("""
-    <div style='background-color:#002b5c;padding:40px;margin-top:50px;border-radius:10px;'>
-        <h3 style='color:white;text-align:center;'>Built for SAP Cloud & On-Premise</h3>
-        <p style='color:white;text-align:center;'>Our platform is designed to simplify, safeguard, and speed up your transformation journey.</p>
-        <div style='display:flex;justify-content:space-around;margin-top:30px;'>
-            <div style='width:30%;text-align:center;'>
-                <h4 style='color:white;'>Data Migration Made Easy</h4>
-                <p style='color:white;'>Supports smooth data preparation and migration for SAP environments.</p>
-            </div>
-            <div style='width:30%;text-align:center;'>
-                <h4 style='color:white;'>Data Integrity & Compliance</h4>
-                <p style='color:white;'>Field-level validation ensures readiness for audits and continuity.</p>
-            </div>
-            <div style='width:30%;text-align:center;'>
-                <h4 style='color:white;'>Document-Ready Migrations</h4>
-                <p style='color:white;'>Generate structured output files ready for upload and compliance.</p>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(SAP_PLATFORM_HTML)
 
 # -------------------- LAUNCH DEMO --------------------
 elif selected == "Launch Demo":
     if st.session_state.demo_page == "main":
-        st.markdown("""
-            <div style='background-color:#e6f0ff;padding:20px;border-radius:10px;margin-bottom:20px;'>
-                <h2 style='text-align:center;'>🚀 Launch Pad</h2>
-                <h4 style='text-align:center;'>Select a migration scenario to get started</h4>
-            </div>
-        """, unsafe_allow_html=True)
+        st.html(LAUNCH_PAD_HEADER_HTML)
 
         col1, col2, col3 = st.columns([1, 3, 1])
         with col2:
@@ -477,13 +481,10 @@ elif selected == "Launch Demo":
         if PAYROLL_WRAPPER_AVAILABLE:
             render_payroll_data_management()
         else:
-            # Fallback to old payroll system
+            # Fallback to old payroll system (imported only when this page is shown)
             try:
-                if 'OLD_PAYROLL_AVAILABLE' in globals() and OLD_PAYROLL_AVAILABLE:
-                    payroll_app.render_payroll_tool()
-                else:
-                    st.error("❌ Payroll system not available.")
-                    st.info("Please check your payroll installation and try again.")
+                from payroll import app as payroll_app
+                payroll_app.render_payroll_tool()
             except Exception as e:
                 st.error("❌ Payroll system not available.")
                 st.info("Please check your payroll installation and try again.")
@@ -496,17 +497,21 @@ elif selected == "Launch Demo":
                 st.rerun()
     
         # Render the enhanced foundation system or fallback to old one
+        render_foundation_data_management = None
         if FOUNDATION_WRAPPER_AVAILABLE:
+            try:
+                from foundation_data_wrapper import render_foundation_data_management
+            except ImportError as e:
+                # The module exists but failed to import: use the old system instead
+                print(f"Foundation wrapper failed to import: {e}")
+        if render_foundation_data_management is not None:
             render_foundation_data_management()
         else:
-            # Fallback to old foundation system
+            # Fallback to old foundation system (imported only when this page is shown)
             try:
-                if 'OLD_FOUNDATION_AVAILABLE' in globals() and OLD_FOUNDATION_AVAILABLE:
-                    st.markdown("### Foundation Data – Interactive View")
-                    render_foundation()
-                else:
-                    st.error("❌ Foundation system not available.")
-                    st.info("Please check your foundation installation and try again.")
+                from foundation_module.foundation_app import render as render_foundation
+                st.markdown("### Foundation Data – Interactive View")
+                render_foundation()
             except Exception as e:
                 st.error("❌ Foundation system not available.")
                 st.info("Please check your foundation installation and try again.")
@@ -561,21 +566,10 @@ elif selected == "Solutions":
 A secure, scalable, audit-ready solution for migrating HR data across SAP On-Premise, S/4HANA, SuccessFactors, and legacy systems.
             """)
 
-            # --- INTERACTIVE BUTTONS WITH TOGGLE ---
-            if "show_fd" not in st.session_state:
-                st.session_state.show_fd = False
-            if "show_emd" not in st.session_state:
-                st.session_state.show_emd = False
-            if "show_pd" not in st.session_state:
-                st.session_state.show_pd = False
-            if "show_ptd" not in st.session_state:
-                st.session_state.show_ptd = False
-
+            # --- EXPANDABLE DATA AREAS (open/close happens client-side, no rerun) ---
             col_a, col_b = st.columns(2)
             with col_a:
-                if st.button("Foundation Data", key="fd_btn"):
-                    st.session_state.show_fd = not st.session_state.show_fd
-                if st.session_state.show_fd:
+                with st.expander("Foundation Data"):
                     if FOUNDATION_WRAPPER_AVAILABLE:
                         st.info("""
 **Enhanced Foundation Processing:**
@@ -599,9 +593,7 @@ A secure, scalable, audit-ready solution for migrating HR data across SAP On-Pre
 - Position Data
                         """)
 
-                if st.button("Employee Data", key="pd_btn"):
-                    st.session_state.show_pd = not st.session_state.show_pd
-                if st.session_state.show_pd:
+                with st.expander("Employee Data"):
                     st.info("""
 - Basic Information  
 - Biographical Information  
@@ -619,9 +611,7 @@ A secure, scalable, audit-ready solution for migrating HR data across SAP On-Pre
                     """)
 
             with col_b:
-                if st.button("Time Data", key="emd_btn"):
-                    st.session_state.show_emd = not st.session_state.show_emd
-                if st.session_state.show_emd:
+                with st.expander("Time Data"):
                     st.info("""
 - Time Type  
 - Time Account Type  
@@ -630,9 +620,7 @@ A secure, scalable, audit-ready solution for migrating HR data across SAP On-Pre
 - Employee Time (Absences)  
                     """)
 
-                if st.button("Payroll Data", key="ptd_btn"):
-                    st.session_state.show_ptd = not st.session_state.show_ptd
-                if st.session_state.show_ptd:
+                with st.expander("Payroll Data"):
                     if PAYROLL_WRAPPER_AVAILABLE:
                         st.info("""
 **Enhanced Payroll Processing:**
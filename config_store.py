@@ -0,0 +1,95 @@
+"""
+Shared Config Store Helpers
+JSON encode/decode and cached loading of *_config.json files for the admin panels
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+# Optional: orjson for faster config encode/decode
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+CONFIG_SUFFIX = "_config.json"
+
+def config_loads(data) -> Any:
+    """Parse config JSON from bytes or str"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def config_dumps(data: Any) -> bytes:
+    """Serialize config data to indented JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2).encode()
+
+def write_config_stream(data: Any, stream) -> None:
+    """Serialize config data as indented JSON into a binary stream"""
+    if ORJSON_AVAILABLE:
+        stream.write(config_dumps(data))
+        return
+    # Encode chunk by chunk so the whole document never exists as one str
+    for chunk in json.JSONEncoder(indent=2).iterencode(data):
+        stream.write(chunk.encode())
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """Write to a temp file and swap it in, so a crash never leaves a half-written config"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+@st.cache_resource(show_spinner=False)
+def ensure_dirs(directories: tuple) -> bool:
+    """Create the given directories once per process"""
+    for directory in directories:
+        Path(directory).mkdir(exist_ok=True)
+    return True
+
+def config_path(config_dir: str, config_type: str) -> str:
+    """File path of a config type inside config_dir"""
+    return os.path.join(config_dir, f"{config_type}{CONFIG_SUFFIX}")
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_cached(config_dir: str, config_type: str, mtime_ns: int) -> Optional[Any]:
+    """Read and parse a config file; mtime_ns is part of the cache key so saves invalidate it"""
+    with open(config_path(config_dir, config_type), "rb") as f:
+        return config_loads(f.read())
+
+def config_fingerprint(config_dir: str) -> tuple:
+    """(config_type, mtime_ns) of every saved config in config_dir, from a single directory scan"""
+    try:
+        with os.scandir(config_dir) as entries:
+            return tuple(sorted(
+                (entry.name[:-len(CONFIG_SUFFIX)], entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.name.endswith(CONFIG_SUFFIX) and entry.is_file()
+            ))
+    except FileNotFoundError:
+        return ()
+
+def load_config(config_dir: str, config_type: str) -> Optional[Any]:
+    """Load one config, or None if it has not been saved"""
+    try:
+        mtime_ns = os.stat(config_path(config_dir, config_type)).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_cached(config_dir, config_type, mtime_ns)
+
+def load_all_configs(config_dir: str, fingerprint: Optional[tuple] = None) -> Dict[str, Any]:
+    """Load every saved config in config_dir as {config_type: data}, through the per-file cache"""
+    if fingerprint is None:
+        fingerprint = config_fingerprint(config_dir)
+    return {config_type: _load_cached(config_dir, config_type, mtime_ns) for config_type, mtime_ns in fingerprint}
+
+def clear_config_cache() -> None:
+    """Drop cached loads so the next rerun reads the files again"""
+    _load_cached.clear()
@@ -1,8 +1,42 @@
 # demo_module.py
 
+import io
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
+
+# Column-name normalisation: drop dots, spaces -> underscores (built once at import)
+COLUMN_NAME_TABLE = str.maketrans({'.': None, ' ': '_'})
+
+def clean_columns(df):
+    df.columns = [str(col).strip().lower().translate(COLUMN_NAME_TABLE) for col in df.columns]
+    return df
+
+def downcast_numeric(df):
+    # float64/int64 -> smallest fitting type; halves memory and the chart payload
+    for col in df.select_dtypes(include='float').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+@st.cache_data(show_spinner=False)
+def load_xlsx(raw):
+    """Parse an uploaded Excel file once per distinct file content"""
+    return downcast_numeric(clean_columns(pd.read_excel(io.BytesIO(raw))))
+
+@st.cache_data(show_spinner=False)
+def describe_frame(df):
+    """Summary statistics, recomputed only when the combined data changes"""
+    return df.describe(include='all')
+
+@st.cache_data(show_spinner=False)
+def column_groups(df):
+    """Numeric and categorical column names for the dashboard builder"""
+    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+    cat_cols = df.select_dtypes(include=['object']).columns.tolist()
+    return numeric_cols, cat_cols
 
 def render():
     st.subheader("🚀 Unified User Processing App")
@@ -25,21 +59,22 @@ def render():
     ])
     combined_df = pd.DataFrame()
 
-    def clean_columns(df):
-        df.columns = df.columns.str.strip().str.lower().str.replace('.', '', regex=False).str.replace(' ', '_')
-        return df
-
     if uploaded_files:
-        for file in uploaded_files:
-            df = pd.read_excel(file)
-            df = clean_columns(df)
-            df['position'] = df.get('position', default_position)
-            df['org_unit'] = df.get('org_unit', default_org_unit)
-            df['location_code'] = df.get('location_code', default_location_code)
-            df['country'] = default_country
-            df['state'] = default_state
-            df['timezone'] = default_timezone
-            combined_df = pd.concat([combined_df, df], ignore_index=True)
+        # Parsed frames are cached and left untouched; the default values are applied
+        # to the combined frame, so changing a default never re-reads the uploads
+        frames = [load_xlsx(file.getvalue()) for file in uploaded_files]
+        combined_df = pd.concat(frames, ignore_index=True)
+
+        # Optional columns: default only the rows from files that don't provide them
+        row_counts = [len(df) for df in frames]
+        for col, default in (('position', default_position),
+                             ('org_unit', default_org_unit),
+                             ('location_code', default_location_code)):
+            missing = [col not in df.columns for df in frames]
+            if any(missing):
+                combined_df.loc[np.repeat(missing, row_counts), col] = default
+
+        combined_df = combined_df.assign(country=default_country, state=default_state, timezone=default_timezone)
 
         with tab1:
             st.success("✅ Files uploaded and merged successfully.")
@@ -51,25 +86,26 @@ def render():
 
         with tab3:
             st.subheader("📊 Summary Statistics")
-            if not combined_df.empty:
-                st.write(combined_df.describe(include='all'))
-            else:
+            # Tab bodies run on every rerun, so heavy work waits until the user asks for it
+            if combined_df.empty:
                 st.info("No data to summarize.")
+            elif st.checkbox("Show summary statistics", value=False, key="demo_show_stats"):
+                st.write(describe_frame(combined_df))
 
         with tab4:
             st.subheader("📈 Dashboard Builder")
-            if not combined_df.empty:
-                numeric_cols = combined_df.select_dtypes(include=['number']).columns.tolist()
-                cat_cols = combined_df.select_dtypes(include=['object']).columns.tolist()
+            if combined_df.empty:
+                st.info("Upload data to build dashboard.")
+            elif st.checkbox("Build dashboard", value=False, key="demo_build_dashboard"):
+                numeric_cols, cat_cols = column_groups(combined_df)
                 col1, col2 = st.columns(2)
                 with col1:
                     x_axis = st.selectbox("X-axis", options=numeric_cols)
                 with col2:
                     y_axis = st.selectbox("Y-axis", options=numeric_cols)
                 if x_axis and y_axis:
+                    import plotly.express as px  # heavy; only needed once a chart is built
                     fig = px.scatter(combined_df, x=x_axis, y=y_axis, color=cat_cols[0] if cat_cols else None)
                     st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("Upload data to build dashboard.")
     else:
         st.info("⬅️ Please upload at least one .xlsx file.")
@@ -3,43 +3,109 @@ Employee Data Management Wrapper
 This file provides a clean interface between the main app and the employee data management system
 """
 
+import importlib
+import importlib.util
 import os
 import sys
 import streamlit as st
 
-# Add the employee_data_management path
-current_dir = os.path.dirname(__file__)
+# Paths of the employee_data_management system
+current_dir = os.path.dirname(os.path.realpath(__file__))
 employee_data_path = os.path.join(current_dir, 'employee_data_management')
 panels_path = os.path.join(employee_data_path, 'panels')
 
-# Add paths to sys.path if they don't exist
-if employee_data_path not in sys.path:
-    sys.path.insert(0, employee_data_path)
-if panels_path not in sys.path:
-    sys.path.insert(0, panels_path)
+# Panel name -> (module, show function); modules are imported only when their panel is opened
+EMPLOYEE_PANELS = {
+    "processing": ("employee_main_panel", "show_employee_panel"),
+    "statistics": ("employee_statistics_panel", "show_employee_statistics_panel"),
+    "validation": ("employee_validation_panel", "show_employee_validation_panel"),
+    "dashboard": ("employee_dashboard_panel", "show_employee_dashboard_panel"),
+    "admin": ("employee_admin_panel", "show_employee_admin_panel")
+}
 
-# Import the employee data management panels
-try:
-    from panels.employee_main_panel import show_employee_panel
-    from panels.employee_statistics_panel import show_employee_statistics_panel  
-    from panels.employee_validation_panel import show_employee_validation_panel
-    from panels.employee_dashboard_panel import show_employee_dashboard_panel
-    from panels.employee_admin_panel import show_employee_admin_panel
-    EMPLOYEE_DATA_AVAILABLE = True
+@st.cache_resource(show_spinner=False)
+def _employee_panels_available() -> bool:
+    """Check once per process that every panel module can be found, without importing it"""
+    # Add paths to sys.path if they don't exist
+    for path in (employee_data_path, panels_path):
+        if path not in sys.path:
+            sys.path.insert(0, path)
     
-except ImportError as e:
-    try:
-        # Fallback - try without panels prefix
-        from employee_main_panel import show_employee_panel
-        from employee_statistics_panel import show_employee_statistics_panel  
-        from employee_validation_panel import show_employee_validation_panel
-        from employee_dashboard_panel import show_employee_dashboard_panel
-        from employee_admin_panel import show_employee_admin_panel
-        EMPLOYEE_DATA_AVAILABLE = True
-        
-    except ImportError as e2:
-        EMPLOYEE_DATA_AVAILABLE = False
-        print(f"Employee data management modules not available: {e2}")
+    missing = [module for module, _ in EMPLOYEE_PANELS.values() if importlib.util.find_spec(module) is None]
+    if missing:
+        print(f"Employee data management modules not available: {', '.join(missing)}")
+        return False
+    return True
+
+@st.cache_resource(show_spinner=False)
+def _load_employee_panel(name: str):
+    """Import a single employee panel on first use and return its show function"""
+    module_name, function_name = EMPLOYEE_PANELS[name]
+    # Bare module name only: 'panels' is also the foundation_data panel package
+    module = importlib.import_module(module_name)
+    return getattr(module, function_name)
+
+EMPLOYEE_DATA_AVAILABLE = _employee_panels_available()
+
+# Panel selector label -> (panel name, about title, about text, spinner text)
+PANEL_DISPATCH = {
+    "🏠 Employee Processing": ("processing", "Employee Processing", """
+    **Employee Processing Panel** handles:
+    - Upload and processing of PA files (PA0001, PA0002, PA0006, PA0105)
+    - Data transformation and mapping
+    - Generation of SuccessFactors-ready output files
+    - Preview and validation of processed data
+    """, None),
+    "📊 Statistics & Detective": ("statistics", "Statistics & Detective", """
+    **Statistics & Detective Panel** provides:
+    - Comprehensive data analysis and insights
+    - Data quality assessment
+    - Pattern detection and anomaly identification
+    - Detailed statistics on employee data
+    """, "Loading statistics..."),
+    "✅ Data Validation": ("validation", "Data Validation", """
+    **Data Validation Panel** performs:
+    - Comprehensive data quality checks
+    - Business rule validation
+    - Data consistency verification
+    - Error reporting and remediation guidance
+    """, "Running validation checks..."),
+    "📈 Dashboard": ("dashboard", "Dashboard", """
+    **Dashboard Panel** displays:
+    - Real-time migration progress
+    - Key performance indicators
+    - Visual data summaries
+    - Migration status overview
+    """, None),
+    "⚙️ Admin Configuration": ("admin", "Admin Configuration", """
+    **Admin Configuration Panel** manages:
+    - System settings and preferences
+    - Mapping configurations
+    - Business rules setup
+    - Advanced system parameters
+    """, None)
+}
+
+# Session state keys of the PA source files
+_PA_STATE_KEYS = ('source_pa0001', 'source_pa0002', 'source_pa0006', 'source_pa0105')
+
+def _count_pa_files(employee_state) -> int:
+    """Count the PA source files loaded into the employee state"""
+    return sum(1 for key in _PA_STATE_KEYS if employee_state.get(key) is not None)
+
+_FOOTER_MD = """
+1. **Start with Processing:** Upload your PA files and generate output first
+2. **Validate Early:** Run validation checks to catch issues before final migration
+3. **Monitor Progress:** Use the dashboard to track your migration status
+4. **Analyze Data:** Use statistics panel to understand your data better
+"""
+
+@st.fragment
+def _render_footer():
+    """Render the static tips footer"""
+    st.markdown("---")
+    st.markdown("**💡 Tips for Success:**")
+    st.markdown(_FOOTER_MD)
 
 def render_employee_data_management():
     """Render the complete employee data management system"""
@@ -71,10 +137,7 @@ def render_employee_data_management():
         return
     
     # Initialize employee session state if not exists
-    if 'employee_state' not in st.session_state:
-        st.session_state.employee_state = {}
-    
-    employee_state = st.session_state.employee_state
+    employee_state = st.session_state.setdefault('employee_state', {})
     
     # Create a container for the employee management system
     with st.container():
@@ -84,24 +147,17 @@ def render_employee_data_management():
         # Navigation for employee panels
         panel_choice = st.selectbox(
             "**Choose Panel:**",
-            [
-                "🏠 Employee Processing",
-                "📊 Statistics & Detective", 
-                "✅ Data Validation",
-                "📈 Dashboard",
-                "⚙️ Admin Configuration"
-            ],
+            tuple(PANEL_DISPATCH),
             key="employee_panel_selection",
             help="Select the panel you want to work with"
         )
         
         # Show quick status in columns
+        pa_files_loaded = _count_pa_files(employee_state)
         st.markdown("#### 📋 Quick Status")
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            pa_files_loaded = sum(1 for file_key in ['PA0001', 'PA0002', 'PA0006', 'PA0105'] 
-                                 if employee_state.get(f'source_{file_key.lower()}') is not None)
             st.metric("📂 PA Files", f"{pa_files_loaded}/4", help="PA files loaded for processing")
         
         with col2:
@@ -127,67 +183,23 @@ def render_employee_data_management():
         
         # Show selected panel
         try:
-            if panel_choice == "🏠 Employee Processing":
-                with st.expander("ℹ️ About Employee Processing", expanded=False):
-                    st.markdown("""
-                    **Employee Processing Panel** handles:
-                    - Upload and processing of PA files (PA0001, PA0002, PA0006, PA0105)
-                    - Data transformation and mapping
-                    - Generation of SuccessFactors-ready output files
-                    - Preview and validation of processed data
-                    """)
-                show_employee_panel(employee_state)
-                
-            elif panel_choice == "📊 Statistics & Detective":
-                with st.expander("ℹ️ About Statistics & Detective", expanded=False):
-                    st.markdown("""
-                    **Statistics & Detective Panel** provides:
-                    - Comprehensive data analysis and insights
-                    - Data quality assessment
-                    - Pattern detection and anomaly identification
-                    - Detailed statistics on employee data
-                    """)
+            panel_name, about_title, about_text, spinner_text = PANEL_DISPATCH[panel_choice]
+            with st.expander(f"ℹ️ About {about_title}", expanded=False):
+                st.markdown(about_text)
+            
+            if panel_name == "statistics":
                 # Add warning for large datasets
                 pa0002_data = employee_state.get('source_pa0002')
                 if pa0002_data is not None and len(pa0002_data) > 10000:
                     st.warning("⚠️ Large dataset detected. Statistics panel may take a moment to load...")
-                
-                with st.spinner("Loading statistics..."):
-                    show_employee_statistics_panel(employee_state)
-                    
-            elif panel_choice == "✅ Data Validation":
-                with st.expander("ℹ️ About Data Validation", expanded=False):
-                    st.markdown("""
-                    **Data Validation Panel** performs:
-                    - Comprehensive data quality checks
-                    - Business rule validation
-                    - Data consistency verification
-                    - Error reporting and remediation guidance
-                    """)
-                with st.spinner("Running validation checks..."):
-                    show_employee_validation_panel(employee_state)
-                    
-            elif panel_choice == "📈 Dashboard":
-                with st.expander("ℹ️ About Dashboard", expanded=False):
-                    st.markdown("""
-                    **Dashboard Panel** displays:
-                    - Real-time migration progress
-                    - Key performance indicators
-                    - Visual data summaries
-                    - Migration status overview
-                    """)
-                show_employee_dashboard_panel(employee_state)
-                
-            elif panel_choice == "⚙️ Admin Configuration":
-                with st.expander("ℹ️ About Admin Configuration", expanded=False):
-                    st.markdown("""
-                    **Admin Configuration Panel** manages:
-                    - System settings and preferences
-                    - Mapping configurations
-                    - Business rules setup
-                    - Advanced system parameters
-                    """)
-                show_employee_admin_panel()
+            
+            show_panel = _load_employee_panel(panel_name)
+            panel_args = () if panel_name == "admin" else (employee_state,)
+            if spinner_text:
+                with st.spinner(spinner_text):
+                    show_panel(*panel_args)
+            else:
+                show_panel(*panel_args)
 
         except Exception as e:
             st.error(f"❌ **Panel Error:** {str(e)}")
@@ -202,14 +214,7 @@ def render_employee_data_management():
                     st.rerun()
                     
         # Footer with helpful information
-        st.markdown("---")
-        st.markdown("**💡 Tips for Success:**")
-        st.markdown("""
-        1. **Start with Processing:** Upload your PA files and generate output first
-        2. **Validate Early:** Run validation checks to catch issues before final migration
-        3. **Monitor Progress:** Use the dashboard to track your migration status
-        4. **Analyze Data:** Use statistics panel to understand your data better
-        """)
+        _render_footer()
 
 def get_employee_system_status():
     """Get current status of the employee data management system"""
@@ -220,8 +225,7 @@ def get_employee_system_status():
         return {"available": True, "initialized": False}
     
     employee_state = st.session_state.employee_state
-    pa_files_loaded = sum(1 for file_key in ['PA0001', 'PA0002', 'PA0006', 'PA0105'] 
-                         if employee_state.get(f'source_{file_key.lower()}') is not None)
+    pa_files_loaded = _count_pa_files(employee_state)
     
     return {
         "available": True,
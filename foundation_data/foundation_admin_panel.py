@@ -5,89 +5,147 @@ Provides secure admin configuration for Foundation Data Management
 
 import streamlit as st
 import pandas as pd
+import io
 import json
 import os
-from pathlib import Path
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Any
 from admin_auth import create_foundation_admin
+from config_store import (
+    atomic_write_bytes, clear_config_cache, config_dumps, config_fingerprint, config_loads,
+    config_path, ensure_dirs, load_all_configs, load_config, write_config_stream
+)
 
 # Configuration directories
 CONFIG_DIR = "foundation_configs"
 TEMPLATE_DIR = "foundation_templates"
 SAMPLE_DIR = "foundation_samples"
 
+# Largest custom JSON text accepted from the admin text areas
+MAX_JSON_INPUT_SIZE = 1_048_576
+
+@contextmanager
+def ui_error(op: str, json_label: Optional[str] = None):
+    """Report any error raised inside the block as a single st.error for the operation"""
+    try:
+        yield
+    except json.JSONDecodeError:
+        st.error(f"❌ Invalid JSON in {json_label or op}")
+    except Exception as e:
+        st.error(f"❌ Error {op}: {e}")
+
 def initialize_foundation_directories():
     """Create required directories if they don't exist"""
-    for directory in [CONFIG_DIR, TEMPLATE_DIR, SAMPLE_DIR]:
-        Path(directory).mkdir(exist_ok=True)
+    return ensure_dirs((CONFIG_DIR, TEMPLATE_DIR, SAMPLE_DIR))
 
-def save_foundation_config(config_type: str, config_data: Any) -> None:
-    """Save foundation configuration to file"""
-    try:
-        config_path = os.path.join(CONFIG_DIR, f"{config_type}_config.json")
-        with open(config_path, "w") as f:
-            json.dump(config_data, f, indent=2)
+def save_foundation_config(config_type: str, config_data: Any) -> bool:
+    """Save foundation configuration to file; returns True once it is written"""
+    with ui_error("saving config"):
+        atomic_write_bytes(get_config_path(config_type), config_dumps(config_data))
+        # Drop cached loads so the next rerun reads the new file
+        clear_config_cache()
+        _build_status_html.clear()
         st.success(f"✅ {config_type.title()} configuration saved!")
-    except Exception as e:
-        st.error(f"❌ Error saving config: {str(e)}")
+        return True
+    return False
+
+# Session key holding (config type, data) of a config saved from a fragment, shown after the app rerun
+_SAVED_PREVIEW_KEY = "foundation_saved_preview"
+
+def _rerun_with_preview(config_type: str, config_data: Any):
+    """Rerun the whole app so the status box outside the fragment picks up the saved config"""
+    st.session_state[_SAVED_PREVIEW_KEY] = (config_type, config_data)
+    st.rerun(scope="app")
+
+def _show_saved_preview(config_type: str, title: str):
+    """Success message and preview of a config saved just before the app rerun"""
+    saved = st.session_state.get(_SAVED_PREVIEW_KEY)
+    if saved and saved[0] == config_type:
+        del st.session_state[_SAVED_PREVIEW_KEY]
+        st.success(f"✅ {config_type.title()} configuration saved!")
+        st.subheader(title)
+        st.json(saved[1])
+
+def get_config_path(config_type: str) -> str:
+    """Get the file path for a foundation configuration type"""
+    return config_path(CONFIG_DIR, config_type)
 
 def load_foundation_config(config_type: str) -> Optional[Any]:
     """Load foundation configuration from file"""
-    try:
-        config_path = os.path.join(CONFIG_DIR, f"{config_type}_config.json")
-        if not os.path.exists(config_path):
-            return None
-        with open(config_path, "r") as f:
-            return json.load(f)
-    except Exception as e:
-        st.error(f"❌ Error loading config: {str(e)}")
-        return None
+    with ui_error("loading config", "config file"):
+        return load_config(CONFIG_DIR, config_type)
+    return None
 
-def show_foundation_configuration_status():
-    """Show current foundation configuration status"""
-    st.subheader("📋 Foundation Configuration Status")
-    st.info("**What this shows:** Current status of your Foundation Data Management configuration")
-    
-    # Check configurations
-    hierarchy_config = load_foundation_config("hierarchy_rules")
-    validation_config = load_foundation_config("validation_rules")
-    processing_config = load_foundation_config("processing_settings")
+def _config_fingerprint() -> tuple:
+    """(config_type, mtime_ns) of every saved config file; changes whenever a config is saved"""
+    return config_fingerprint(CONFIG_DIR)
+
+def load_all_foundation_configs() -> Dict[str, Any]:
+    """Load all saved foundation configurations as {config_type: data}"""
+    with ui_error("loading config", "config file"):
+        return load_all_configs(CONFIG_DIR)
+    return {}
+
+# Alert box styles matching Streamlit's success/warning/error/info colours
+STATUS_BOX_STYLES = {
+    "success": "background-color: rgba(33, 195, 84, 0.1); color: rgb(23, 114, 51);",
+    "warning": "background-color: rgba(255, 227, 18, 0.1); color: rgb(146, 108, 5);",
+    "error": "background-color: rgba(255, 43, 43, 0.09); color: rgb(125, 53, 59);",
+    "info": "background-color: rgba(28, 131, 225, 0.1); color: rgb(0, 66, 128);"
+}
+
+def _status_box(kind: str, text: str) -> str:
+    return f"<div style='{STATUS_BOX_STYLES[kind]} padding: 0.75rem 1rem; border-radius: 0.5rem;'>{text}</div>"
+
+@st.cache_data(show_spinner=False)
+def _build_status_html(fingerprint: tuple) -> str:
+    """Render the configuration status block as HTML; rebuilt only when a config file changes"""
+    configs = load_all_configs(CONFIG_DIR, fingerprint)
+    hierarchy_config = configs.get("hierarchy_rules")
+    validation_config = configs.get("validation_rules")
+    processing_config = configs.get("processing_settings")
+    
+    if hierarchy_config:
+        hierarchy = ("success", "✅ <strong>Hierarchy Rules</strong>", f"{len(hierarchy_config.get('rules', []))} rules configured")
+    else:
+        hierarchy = ("error", "❌ <strong>Hierarchy Rules</strong>", "Not configured")
     
-    col1, col2, col3 = st.columns(3)
+    if validation_config:
+        validation = ("success", "✅ <strong>Validation Rules</strong>", f"{len(validation_config.get('rules', []))} rules active")
+    else:
+        validation = ("error", "❌ <strong>Validation Rules</strong>", "Using defaults")
     
-    with col1:
-        if hierarchy_config:
-            st.success("✅ **Hierarchy Rules**")
-            st.caption(f"{len(hierarchy_config.get('rules', []))} rules configured")
-        else:
-            st.error("❌ **Hierarchy Rules**")
-            st.caption("Not configured")
+    if processing_config:
+        processing = ("success", "✅ <strong>Processing Settings</strong>", "Custom settings active")
+    else:
+        processing = ("warning", "⚠️ <strong>Processing Settings</strong>", "Using defaults")
     
-    with col2:
-        if validation_config:
-            st.success("✅ **Validation Rules**")
-            st.caption(f"{len(validation_config.get('rules', []))} rules active")
-        else:
-            st.error("❌ **Validation Rules**")
-            st.caption("Using defaults")
-    
-    with col3:
-        if processing_config:
-            st.success("✅ **Processing Settings**")
-            st.caption("Custom settings active")
-        else:
-            st.warning("⚠️ **Processing Settings**")
-            st.caption("Using defaults")
+    columns = "".join(
+        f"<div style='flex: 1;'>{_status_box(kind, title)}"
+        f"<p style='font-size: 0.875rem; opacity: 0.7; margin: 0.25rem 0 0 0;'>{caption}</p></div>"
+        for kind, title, caption in (hierarchy, validation, processing)
+    )
     
     # Overall status
     config_count = sum(1 for config in [hierarchy_config, validation_config, processing_config] if config)
     if config_count == 3:
-        st.success("🎉 **Foundation Configuration Complete!**")
+        overall = _status_box("success", "🎉 <strong>Foundation Configuration Complete!</strong>")
     elif config_count > 0:
-        st.warning(f"⚠️ **Configuration Partial** - {config_count}/3 components configured")
+        overall = _status_box("warning", f"⚠️ <strong>Configuration Partial</strong> - {config_count}/3 components configured")
     else:
-        st.info("ℹ️ **Configuration Not Started** - Using system defaults")
+        overall = _status_box("info", "ℹ️ <strong>Configuration Not Started</strong> - Using system defaults")
+    
+    return f"<div style='display: flex; gap: 1rem; margin-bottom: 1rem;'>{columns}</div>{overall}"
 
+def show_foundation_configuration_status():
+    """Show current foundation configuration status"""
+    st.subheader("📋 Foundation Configuration Status")
+    st.info("**What this shows:** Current status of your Foundation Data Management configuration")
+    
+    with ui_error("loading config", "config file"):
+        st.markdown(_build_status_html(_config_fingerprint()), unsafe_allow_html=True)
+
+@st.fragment
 def configure_hierarchy_rules():
     """Configure foundation hierarchy processing rules"""
     st.subheader("🏗️ Hierarchy Processing Rules")
@@ -143,18 +201,24 @@ def configure_hierarchy_rules():
     
     level_names = current_config["level_names"]
     
-    # Show current level names with editing
-    for level in range(1, max_levels + 1):
-        level_str = str(level)
-        current_name = level_names.get(level_str, f"Level {level}")
-        
-        new_name = st.text_input(
-            f"Level {level} Name:",
-            value=current_name,
-            key=f"level_name_{level}",
-            help=f"What to call hierarchy level {level}"
-        )
-        level_names[level_str] = new_name
+    # Show current level names in a single editable table
+    levels_df = pd.DataFrame({
+        "level": range(1, max_levels + 1),
+        "name": [level_names.get(str(level), f"Level {level}") for level in range(1, max_levels + 1)]
+    })
+    edited_levels = st.data_editor(
+        levels_df,
+        num_rows="fixed",
+        disabled=["level"],
+        hide_index=True,
+        use_container_width=True,
+        key="level_names_editor",
+        column_config={
+            "level": st.column_config.NumberColumn("Level", help="Hierarchy level"),
+            "name": st.column_config.TextColumn("Name", help="What to call this hierarchy level")
+        }
+    )
+    level_names.update({str(row.level): row.name for row in edited_levels.itertuples(index=False)})
     
     # Custom validation rules
     st.markdown("### ✅ Custom Validation Rules")
@@ -168,8 +232,12 @@ def configure_hierarchy_rules():
     
     # Save configuration
     if st.button("💾 Save Hierarchy Configuration", type="primary"):
-        try:
-            custom_rules = json.loads(validation_rules) if validation_rules.strip() else {}
+        if len(validation_rules) > MAX_JSON_INPUT_SIZE:
+            st.error("❌ Custom validation rules are too large (max 1 MB)")
+            return
+        saved = False
+        with ui_error("saving configuration", "custom validation rules"):
+            custom_rules = config_loads(validation_rules) if validation_rules.strip() else {}
             
             config_data = {
                 "max_levels": max_levels,
@@ -180,17 +248,14 @@ def configure_hierarchy_rules():
                 "updated": pd.Timestamp.now().isoformat()
             }
             
-            save_foundation_config("hierarchy_rules", config_data)
-            
-            # Show preview
-            st.subheader("✅ Configuration Preview")
-            st.json(config_data)
-            
-        except json.JSONDecodeError:
-            st.error("❌ Invalid JSON in custom validation rules")
-        except Exception as e:
-            st.error(f"❌ Error saving configuration: {str(e)}")
+            saved = save_foundation_config("hierarchy_rules", config_data)
+        
+        if saved:
+            _rerun_with_preview("hierarchy_rules", config_data)
+    
+    _show_saved_preview("hierarchy_rules", "✅ Configuration Preview")
 
+@st.fragment
 def configure_processing_settings():
     """Configure foundation data processing settings"""
     st.subheader("⚙️ Processing Settings")
@@ -283,8 +348,12 @@ def configure_processing_settings():
     
     # Save settings
     if st.button("💾 Save Processing Settings", type="primary"):
-        try:
-            custom_mappings = json.loads(field_mappings) if field_mappings.strip() else {}
+        if len(field_mappings) > MAX_JSON_INPUT_SIZE:
+            st.error("❌ Custom field mappings are too large (max 1 MB)")
+            return
+        saved = False
+        with ui_error("saving settings", "field mappings"):
+            custom_mappings = config_loads(field_mappings) if field_mappings.strip() else {}
             
             settings_data = {
                 "batch_size": batch_size,
@@ -299,16 +368,12 @@ def configure_processing_settings():
                 "updated": pd.Timestamp.now().isoformat()
             }
             
-            save_foundation_config("processing_settings", settings_data)
-            
-            # Show preview
-            st.subheader("✅ Settings Preview")
-            st.json(settings_data)
-            
-        except json.JSONDecodeError:
-            st.error("❌ Invalid JSON in field mappings")
-        except Exception as e:
-            st.error(f"❌ Error saving settings: {str(e)}")
+            saved = save_foundation_config("processing_settings", settings_data)
+        
+        if saved:
+            _rerun_with_preview("processing_settings", settings_data)
+    
+    _show_saved_preview("processing_settings", "✅ Settings Preview")
 
 def system_maintenance():
     """System maintenance and cleanup tools"""
@@ -323,27 +388,26 @@ def system_maintenance():
     with col1:
         st.markdown("**📥 Backup Configuration**")
         if st.button("📦 Create Backup"):
-            try:
+            with ui_error("creating backup"):
                 # Collect all configurations
+                configs = load_all_foundation_configs()
                 backup_data = {
-                    "hierarchy_rules": load_foundation_config("hierarchy_rules"),
-                    "validation_rules": load_foundation_config("validation_rules"),
-                    "processing_settings": load_foundation_config("processing_settings"),
+                    "hierarchy_rules": configs.get("hierarchy_rules"),
+                    "validation_rules": configs.get("validation_rules"),
+                    "processing_settings": configs.get("processing_settings"),
                     "backup_timestamp": pd.Timestamp.now().isoformat()
                 }
                 
                 # Create downloadable backup
-                backup_json = json.dumps(backup_data, indent=2)
+                backup_buffer = io.BytesIO()
+                write_config_stream(backup_data, backup_buffer)
                 st.download_button(
                     "📥 Download Backup",
-                    data=backup_json,
+                    data=backup_buffer,
                     file_name=f"foundation_config_backup_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json",
                     mime="application/json"
                 )
                 st.success("✅ Backup created successfully!")
-                
-            except Exception as e:
-                st.error(f"❌ Error creating backup: {str(e)}")
     
     with col2:
         st.markdown("**📤 Restore Configuration**")
@@ -354,8 +418,9 @@ def system_maintenance():
         )
         
         if restore_file and st.button("🔄 Restore Configuration"):
-            try:
-                backup_data = json.load(restore_file)
+            with ui_error("restoring configuration", "backup file"):
+                # The uploader already holds the bytes; parse them in one pass
+                backup_data = config_loads(restore_file.getvalue())
                 
                 # Restore each configuration
                 for config_type, config_data in backup_data.items():
@@ -364,9 +429,6 @@ def system_maintenance():
                 
                 st.success("✅ Configuration restored successfully!")
                 st.info("Please refresh the page to see restored settings")
-                
-            except Exception as e:
-                st.error(f"❌ Error restoring configuration: {str(e)}")
     
     # Clear cache and reset
     st.markdown("### 🗑️ Clear Data & Reset")
@@ -385,78 +447,75 @@ def system_maintenance():
         if st.button("⚠️ Reset All Configuration", type="secondary"):
             st.warning("This will delete all configuration files!")
             if st.checkbox("I understand this cannot be undone"):
-                try:
-                    # Remove configuration files
-                    for config_file in Path(CONFIG_DIR).glob("*.json"):
-                        config_file.unlink()
+                with ui_error("resetting"):
+                    # Remove configuration files; DirEntry carries the file type, so each entry is not stat'ed again
+                    with os.scandir(CONFIG_DIR) as entries:
+                        for entry in entries:
+                            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                                os.unlink(entry.path)
+                    clear_config_cache()
+                    _build_status_html.clear()
                     st.success("✅ All configurations reset!")
-                except Exception as e:
-                    st.error(f"❌ Error resetting: {str(e)}")
 
+@create_foundation_admin().require_auth
 def show_foundation_admin_panel():
     """Main foundation admin panel with authentication"""
-    auth = create_foundation_admin()
-    
-    def foundation_admin_content():
-        # Clean header
+    # Clean header
+    st.markdown("""
+    <div style="background: linear-gradient(90deg, #059669 0%, #10b981 100%); 
+                color: white; padding: 2rem; border-radius: 10px; margin-bottom: 2rem;">
+        <h1 style="margin: 0; font-size: 2.5rem;">🏢 Foundation Configuration Center</h1>
+        <p style="margin: 0.5rem 0 0 0; font-size: 1.2rem; opacity: 0.9;">
+            Configure how your HRP1000 & HRP1001 files are processed for organizational hierarchy
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Initialize directories
+    initialize_foundation_directories()
+    
+    # Configuration status at top
+    show_foundation_configuration_status()
+    
+    st.markdown("---")
+    
+    # Main tabs
+    tabs = st.tabs([
+        "🏗️ Hierarchy Rules",
+        "⚙️ Processing Settings", 
+        "🔧 System Maintenance"
+    ])
+    
+    with tabs[0]:
+        configure_hierarchy_rules()
+    
+    with tabs[1]:
+        configure_processing_settings()
+    
+    with tabs[2]:
+        system_maintenance()
+    
+    # Help section
+    st.markdown("---")
+    with st.expander("❓ Foundation Configuration Help", expanded=False):
         st.markdown("""
-        <div style="background: linear-gradient(90deg, #059669 0%, #10b981 100%); 
-                    color: white; padding: 2rem; border-radius: 10px; margin-bottom: 2rem;">
-            <h1 style="margin: 0; font-size: 2.5rem;">🏢 Foundation Configuration Center</h1>
-            <p style="margin: 0.5rem 0 0 0; font-size: 1.2rem; opacity: 0.9;">
-                Configure how your HRP1000 & HRP1001 files are processed for organizational hierarchy
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Initialize directories
-        initialize_foundation_directories()
+        **Foundation Configuration Overview:**
         
-        # Configuration status at top
-        show_foundation_configuration_status()
+        🏗️ **Hierarchy Rules:** Define how organizational structures are processed and validated
+        ⚙️ **Processing Settings:** Control performance, output format, and data quality settings
+        🔧 **System Maintenance:** Backup/restore configurations and system cleanup
         
-        st.markdown("---")
+        **Important Files:**
+        - **HRP1000:** Contains organizational objects (departments, positions, etc.)
+        - **HRP1001:** Contains organizational relationships (who reports to whom)
         
-        # Main tabs
-        tabs = st.tabs([
-            "🏗️ Hierarchy Rules",
-            "⚙️ Processing Settings", 
-            "🔧 System Maintenance"
-        ])
+        **Common Tasks:**
+        1. **Set Hierarchy Levels:** Define names for organizational levels (Division, Department, etc.)
+        2. **Configure Processing:** Set batch sizes and error handling for large files
+        3. **Backup Settings:** Save your configuration before making major changes
         
-        with tabs[0]:
-            configure_hierarchy_rules()
-        
-        with tabs[1]:
-            configure_processing_settings()
-        
-        with tabs[2]:
-            system_maintenance()
-        
-        # Help section
-        st.markdown("---")
-        with st.expander("❓ Foundation Configuration Help", expanded=False):
-            st.markdown("""
-            **Foundation Configuration Overview:**
-            
-            🏗️ **Hierarchy Rules:** Define how organizational structures are processed and validated
-            ⚙️ **Processing Settings:** Control performance, output format, and data quality settings
-            🔧 **System Maintenance:** Backup/restore configurations and system cleanup
-            
-            **Important Files:**
-            - **HRP1000:** Contains organizational objects (departments, positions, etc.)
-            - **HRP1001:** Contains organizational relationships (who reports to whom)
-            
-            **Common Tasks:**
-            1. **Set Hierarchy Levels:** Define names for organizational levels (Division, Department, etc.)
-            2. **Configure Processing:** Set batch sizes and error handling for large files
-            3. **Backup Settings:** Save your configuration before making major changes
-            
-            **Tips:**
-            - Start with default settings and adjust based on your data size
-            - Use circular reference detection to catch organizational loops
-            - Regular backups prevent configuration loss
-            """)
-    
-    # Apply authentication wrapper
-    auth.require_auth(foundation_admin_content)
+        **Tips:**
+        - Start with default settings and adjust based on your data size
+        - Use circular reference detection to catch organizational loops
+        - Regular backups prevent configuration loss
+        """)
@@ -1120,13 +1120,15 @@ def show_hierarchy_panel(state):
     with st.spinner("Analyzing hierarchy structure..."):
         hierarchy = analyze_hierarchy_structure(hrp1000_df, hrp1001_df)
         state['hierarchy_structure'] = hierarchy
+        # Stored alongside the hierarchy so readers never rescan it for the depth
+        state['hierarchy_max_level'] = max((info.get('level', 1) for info in hierarchy.values()), default=0)
     
     if not hierarchy:
         st.error("Failed to analyze hierarchy structure from the data.")
         return
     
     # Display hierarchy summary
-    max_level = max([info.get('level', 1) for info in hierarchy.values()])
+    max_level = state['hierarchy_max_level']
     st.subheader("Hierarchy Analysis")
     st.info("**Your organizational structure has been analyzed and organized into hierarchy levels. Each level represents a tier in your organization, from top-level (Level 1) down to operational units.**")
     
@@ -4,6 +4,7 @@ import json
 import os
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 import sys
 
 # Set recursion limit higher
@@ -37,30 +38,33 @@ def get_default_mappings():
         }
     ]
 
+# Improved default level names; read-only, callers get a mutable copy
+DEFAULT_LEVEL_NAMES = MappingProxyType({
+    1: "Level1_LegalEntity",
+    2: "Level2_BusinessUnit", 
+    3: "Level3_Division",
+    4: "Level4_SubDivision",
+    5: "Level5_Department",
+    6: "Level6_SubDepartment",
+    7: "Level7_Team",
+    8: "Level8_Unit",
+    9: "Level9_Unit", 
+    10: "Level10_Unit",
+    11: "Level11_Unit",
+    12: "Level12_Unit",
+    13: "Level13_Unit",
+    14: "Level14_Unit",
+    15: "Level15_Unit",
+    16: "Level16_Unit",
+    17: "Level17_Unit",
+    18: "Level18_Unit",
+    19: "Level19_Unit",
+    20: "Level20_Unit"
+})
+
 def get_default_level_names():
     """Get improved default level names"""
-    return {
-        1: "Level1_LegalEntity",
-        2: "Level2_BusinessUnit", 
-        3: "Level3_Division",
-        4: "Level4_SubDivision",
-        5: "Level5_Department",
-        6: "Level6_SubDepartment",
-        7: "Level7_Team",
-        8: "Level8_Unit",
-        9: "Level9_Unit", 
-        10: "Level10_Unit",
-        11: "Level11_Unit",
-        12: "Level12_Unit",
-        13: "Level13_Unit",
-        14: "Level14_Unit",
-        15: "Level15_Unit",
-        16: "Level16_Unit",
-        17: "Level17_Unit",
-        18: "Level18_Unit",
-        19: "Level19_Unit",
-        20: "Level20_Unit"
-    }
+    return dict(DEFAULT_LEVEL_NAMES)
 
 def convert_german_date(value):
     """Convert German date format (dd.mm.yyyy) to ISO format (yyyy-mm-dd)"""
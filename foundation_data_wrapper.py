@@ -1,86 +1,237 @@
 """
-Foundation Data Management Wrapper - Minimal Working Version
+Foundation Data Management Wrapper
+This file provides a clean interface between the main app and the foundation data management system.
+Panel modules are imported only when their panel is opened.
 """
 
+import importlib
+import logging
 import os
 import sys
+from functools import lru_cache
+from types import SimpleNamespace
 import streamlit as st
 
-# Add foundation_data to path
-current_dir = os.path.dirname(__file__)
+_log = logging.getLogger(__name__)
+# Set FOUNDATION_DEBUG=1 to log every panel import attempt
+_DEBUG = os.environ.get("FOUNDATION_DEBUG") == "1"
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
 foundation_data_path = os.path.join(current_dir, 'foundation_data')
 
-if os.path.exists(foundation_data_path):
-    sys.path.insert(0, foundation_data_path)
+# Panel name -> candidate (module, show function) pairs, enhanced version first.
+# Modules are imported only when their panel is opened. Panels are imported through the
+# foundation_data package so they never collide with employee_data_management's 'panels'.
+_PANEL_LOADERS = {
+    "hierarchy": (("foundation_data.panels.hierarchy_panel_fixed", "show_hierarchy_panel"),),
+    "validation": (("foundation_data.panels.enhanced_validation_panel", "show_validation_panel"),
+                   ("foundation_data.panels.validation_panel_fixed", "show_validation_panel")),
+    "statistics": (("foundation_data.panels.statistics_panel_enhanced", "show_statistics_panel"),
+                   ("foundation_data.panels.statistics_panel", "show_statistics_panel")),
+    "health_monitor": (("foundation_data.panels.dashboard_panel_fixed", "show_health_monitor_panel"),
+                       ("foundation_data.panels.dashboard_panel", "show_health_monitor_panel")),
+    "admin": (("config_manager", "show_admin_panel"),)
+}
 
-# Try to import foundation panels - with maximum error tolerance
-try:
-    # Try to import main panel - this is the most important one
-    from panels.hierarchy_panel_fixed import show_hierarchy_panel
-    FOUNDATION_AVAILABLE = True
-    print("✅ Foundation hierarchy panel imported successfully")
-    
-    # Try other panels with individual error handling
-    try:
-        from panels.enhanced_validation_panel import show_validation_panel
-        VALIDATION_ENHANCED = True
-    except:
-        try:
-            from panels.validation_panel_fixed import show_validation_panel
-            VALIDATION_ENHANCED = False
-        except:
-            def show_validation_panel(state):
-                st.info("Validation panel not available")
-            VALIDATION_ENHANCED = False
-    
+_PANEL_UNAVAILABLE = {
+    "hierarchy": "Foundation panels not available",
+    "validation": "Validation panel not available",
+    "statistics": "Statistics panel not available",
+    "health_monitor": "Health monitor panel not available",
+    "admin": "Admin panel not available"
+}
+
+def _ensure_path(path: str) -> None:
+    """Put a directory at the front of sys.path unless it is already there"""
+    if path and os.path.isdir(path) and path not in sys.path:
+        sys.path.insert(0, path)
+
+def _scan_modules(path: str) -> frozenset:
+    """Basenames of the .py files in a directory, from a single scandir"""
     try:
-        from panels.statistics_panel_enhanced import show_statistics_panel
-        STATISTICS_ENHANCED = True
-    except:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name[:-3] for entry in entries if entry.name.endswith('.py') and entry.is_file())
+    except OSError:
+        return frozenset()
+
+@st.cache_resource(show_spinner=False)
+def _probe_foundation_layout() -> SimpleNamespace:
+    """Scan foundation_data and its panels folder once per process"""
+    return SimpleNamespace(
+        data_exists=os.path.isdir(foundation_data_path),
+        modules=_scan_modules(foundation_data_path),
+        panel_modules=_scan_modules(os.path.join(foundation_data_path, 'panels'))
+    )
+
+def _module_exists(module_name: str) -> bool:
+    """Check that a panel module's source file is present under foundation_data"""
+    layout = _probe_foundation_layout()
+    package, _, module = module_name.rpartition('.')
+    return module in (layout.panel_modules if package == 'foundation_data.panels' else layout.modules)
+
+# Whether the enhanced module was the one loaded, filled in as panels are resolved
+_enhanced_panels = {}
+
+# (module name, exception) for every failed panel import; formatted only when displayed
+_import_errors = []
+
+def _render_import_errors(module_names):
+    """Show the recorded import failures of the given modules"""
+    errors = [(module, exc) for module, exc in _import_errors if module in module_names]
+    for i, (module, exc) in enumerate(errors, 1):
+        st.code(f"{i}. [{module}] {exc!r}")
+
+def _try_import(candidates):
+    """Import the first candidate whose module is present; returns (show function, module name) or (None, None)"""
+    for module_name, function_name in candidates:
+        # Missing modules are skipped without going through the import machinery
+        if not _module_exists(module_name):
+            continue
         try:
-            from panels.statistics_panel import show_statistics_panel
-            STATISTICS_ENHANCED = False
-        except:
-            def show_statistics_panel(state):
-                st.info("Statistics panel not available")
-            STATISTICS_ENHANCED = False
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
+            return getattr(module, function_name), module_name
+        except (ImportError, AttributeError) as e:
+            _import_errors.append((module_name, e))
+            if _DEBUG:
+                _log.debug("Foundation panel %s failed to import: %s", module_name, e)
+    return None, None
+
+@lru_cache(maxsize=None)
+def _get_panel(name: str):
+    """Import a foundation panel on first use and return its show function"""
+    candidates = _PANEL_LOADERS[name]
+    show_panel, source = _try_import(candidates)
+    # Only panels with a basic fallback have an enhanced version
+    _enhanced_panels[name] = len(candidates) > 1 and source == candidates[0][0]
     
-    try:
-        from panels.dashboard_panel_fixed import show_health_monitor_panel
-        HEALTH_MONITOR_ENHANCED = True
-    except:
-        try:
-            from panels.dashboard_panel import show_health_monitor_panel
-            HEALTH_MONITOR_ENHANCED = False
-        except:
-            def show_health_monitor_panel(state):
-                st.info("Health monitor panel not available")
-            HEALTH_MONITOR_ENHANCED = False
+    if show_panel is None:
+        if _DEBUG:
+            _log.debug("Foundation %s panel not available", name)
+        message = _PANEL_UNAVAILABLE[name]
+        module_names = frozenset(module_name for module_name, _ in candidates)
+        def show_panel(*args):
+            st.info(message)
+            if any(module in module_names for module, _ in _import_errors):
+                with st.expander("🔍 Import details", expanded=False):
+                    _render_import_errors(module_names)
+    elif _DEBUG:
+        _log.debug("Foundation %s panel imported from %s", name, source)
     
+    return show_panel
+
+def _is_enhanced(name: str) -> bool:
+    """Whether the enhanced version of a panel is (or would be) used, without importing it"""
+    if name in _enhanced_panels:
+        return _enhanced_panels[name]
+    return _module_exists(_PANEL_LOADERS[name][0][0])
+
+# Public names the wrapper used to import eagerly -> panel they resolve from
+_LAZY_SHOW_FUNCTIONS = {
+    "show_hierarchy_panel": "hierarchy",
+    "show_validation_panel": "validation",
+    "show_statistics_panel": "statistics",
+    "show_health_monitor_panel": "health_monitor",
+    "show_admin_panel": "admin"
+}
+_LAZY_ENHANCED_FLAGS = {
+    "VALIDATION_ENHANCED": "validation",
+    "STATISTICS_ENHANCED": "statistics",
+    "HEALTH_MONITOR_ENHANCED": "health_monitor"
+}
+
+_ENHANCED_FLAG_PANELS = frozenset(_LAZY_ENHANCED_FLAGS.values())
+
+def __getattr__(name: str):
+    """Resolve the panel show functions and enhanced flags on first access (PEP 562)"""
+    if name in _LAZY_SHOW_FUNCTIONS:
+        value = _get_panel(_LAZY_SHOW_FUNCTIONS[name])
+        # Later lookups find the module global and skip __getattr__
+        globals()[name] = value
+        return value
+    if name in _LAZY_ENHANCED_FLAGS:
+        return _is_enhanced(_LAZY_ENHANCED_FLAGS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# The hierarchy panel is required; the rest fall back to basic versions or stubs.
+# foundation_data is only put on sys.path when it actually holds the panels.
+FOUNDATION_AVAILABLE = _module_exists("foundation_data.panels.hierarchy_panel_fixed")
+if FOUNDATION_AVAILABLE:
+    _ensure_path(current_dir)
+    _ensure_path(foundation_data_path)
+_log.info("Foundation panels %s", "available" if FOUNDATION_AVAILABLE else "not available")
+
+# Panel selector label -> (panel name, run in a fragment).
+# Panels that write to the sidebar cannot run inside a fragment.
+_PANEL_DISPATCH = {
+    "🏢 Hierarchy Processing": ("hierarchy", True),
+    "✅ Data Validation": ("validation", True),
+    "📊 Statistics & Analytics": ("statistics", True),
+    "🏥 Health Monitor": ("health_monitor", False),
+    "⚙️ Admin Configuration": ("admin", False)
+}
+_FOUNDATION_PANEL_CHOICES = tuple(_PANEL_DISPATCH)
+
+@st.fragment
+def _panel_fragment(name: str, foundation_state):
+    """Render a panel so its own widget changes rerun only the panel, not the wrapper"""
     try:
-        from config_manager import show_admin_panel
-    except:
-        def show_admin_panel():
-            st.info("Admin panel not available")
+        _get_panel(name)(foundation_state)
+    except Exception as e:
+        st.error(f"❌ Panel Error: {str(e)}")
+        st.info("Try refreshing the page or switching to a different panel")
+
+def _render_admin_configuration(foundation_state):
+    """Admin configuration behind the admin-mode checkbox"""
+    st.markdown("### Admin Configuration")
     
-except Exception as e:
-    print(f"❌ Foundation panels import failed: {e}")
-    FOUNDATION_AVAILABLE = False
-    VALIDATION_ENHANCED = False
-    STATISTICS_ENHANCED = False
-    HEALTH_MONITOR_ENHANCED = False
+    # Simplified admin mode - no password required for now
+    admin_enabled = st.checkbox("Enable Admin Mode", help="Enable configuration options")
     
-    # Create dummy functions
-    def show_hierarchy_panel(state):
-        st.error("Foundation panels not available")
-    def show_validation_panel(state):
-        st.error("Validation panel not available")
-    def show_statistics_panel(state):
-        st.error("Statistics panel not available")
-    def show_health_monitor_panel(state):
-        st.error("Health monitor panel not available")
-    def show_admin_panel():
-        st.error("Admin panel not available")
+    if admin_enabled:
+        foundation_state['admin_mode'] = True
+        st.success("✅ Admin mode activated for Foundation")
+        
+        # Add admin warning
+        st.warning("⚠️ Admin mode: Use carefully as changes affect system behavior")
+        
+        try:
+            _get_panel("admin")()
+        except Exception as e:
+            st.error(f"Admin panel error: {str(e)}")
+            st.info("Admin panel may not be fully configured yet")
+    else:
+        foundation_state['admin_mode'] = False
+        st.info("💡 Enable admin mode to access advanced configuration options.")
+
+_HEADER_MD = "### 🏢 Foundation Data Management System"
+_SUBHEADER_MD = "*Advanced organizational hierarchy processing for SAP HCM → SuccessFactors migration*"
+
+def _render_header():
+    """Static title of the foundation system"""
+    st.markdown(_HEADER_MD)
+    st.markdown(_SUBHEADER_MD)
+
+def _enhancement_is_mixed() -> bool:
+    """True when some panels run enhanced and others basic; otherwise the note says nothing new"""
+    flags = [_is_enhanced(name) for name in _ENHANCED_FLAG_PANELS]
+    return any(flags) and not all(flags)
+
+def _render_selected_panel(panel_choice: str, foundation_state):
+    """Render the selected panel; fragment-safe panels rerun on their own"""
+    try:
+        panel_name, in_fragment = _PANEL_DISPATCH[panel_choice]
+        if panel_name in _ENHANCED_FLAG_PANELS and _enhancement_is_mixed():
+            st.caption("✨ Enhanced version" if _is_enhanced(panel_name) else "Basic version")
+        
+        if panel_name == "admin":
+            _render_admin_configuration(foundation_state)
+        elif in_fragment:
+            _panel_fragment(panel_name, foundation_state)
+        else:
+            _get_panel(panel_name)(foundation_state)
+    except Exception as e:
+        st.error(f"❌ Panel Error: {str(e)}")
+        st.info("Try refreshing the page or switching to a different panel")
 
 def render_foundation_data_management():
     """Render the foundation data management system"""
@@ -101,68 +252,86 @@ def render_foundation_data_management():
     
     foundation_state = st.session_state.foundation_state
     
-    st.markdown("### 🏢 Foundation Data Management System")
-    st.markdown("*Advanced organizational hierarchy processing for SAP HCM → SuccessFactors migration*")
+    _render_header()
     
     # Simple panel navigation
     panel_choice = st.selectbox(
         "**Choose Panel:**",
-        [
-            "🏢 Hierarchy Processing",
-            "✅ Data Validation", 
-            "📊 Statistics & Analytics",
-            "🏥 Health Monitor",
-            "⚙️ Admin Configuration"
-        ],
-        key="foundation_panel_selection"
+        _FOUNDATION_PANEL_CHOICES,
+        key="foundation_panel_selection",
+        help="Select the panel you want to work with"
     )
     
     st.markdown("---")
     
     # Show selected panel
-    try:
-        if panel_choice == "🏢 Hierarchy Processing":
-            show_hierarchy_panel(foundation_state)
-        elif panel_choice == "✅ Data Validation":
-            show_validation_panel(foundation_state)
-        elif panel_choice == "📊 Statistics & Analytics":
-            show_statistics_panel(foundation_state)
-        elif panel_choice == "🏥 Health Monitor":
-            show_health_monitor_panel(foundation_state)
-        # Replace the admin configuration section in your foundation_data_wrapper.py:
-        
-        elif panel_choice == "⚙️ Admin Configuration":
-            st.markdown("### Admin Configuration")
-            
-            # Simplified admin mode - no password required for now
-            admin_enabled = st.checkbox("Enable Admin Mode", help="Enable configuration options")
-            
-            if admin_enabled:
-                foundation_state['admin_mode'] = True
-                st.success("✅ Admin mode activated for Foundation")
-                
-                # Add admin warning
-                st.warning("⚠️ Admin mode: Use carefully as changes affect system behavior")
-                
-                try:
-                    show_admin_panel()
-                except Exception as e:
-                    st.error(f"Admin panel error: {str(e)}")
-                    st.info("Admin panel may not be fully configured yet")
-            else:
-                foundation_state['admin_mode'] = False
-                st.info("💡 Enable admin mode to access advanced configuration options.")
-    except Exception as e:
-        st.error(f"❌ Panel Error: {str(e)}")
-        st.info("Try refreshing the page or switching to a different panel")
+    _render_selected_panel(panel_choice, foundation_state)
 
-def get_foundation_system_status():
-    """Get foundation system status"""
+def _hierarchy_max_level(foundation_state, hierarchy) -> int:
+    """Deepest hierarchy level; the hierarchy panel stores it when it writes the hierarchy"""
+    if not hierarchy:
+        return 0
+    max_level = foundation_state.get('hierarchy_max_level')
+    if max_level is None:
+        # Hierarchy written before the panel recorded its depth
+        max_level = foundation_state.setdefault(
+            'hierarchy_max_level', max((info.get('level', 1) for info in hierarchy.values()), default=0)
+        )
+    return max_level
+
+def _first_present(state, *keys):
+    """First value among keys that is not None, with one lookup per key"""
+    for key in keys:
+        value = state.get(key)
+        if value is not None:
+            return value
+    return None
+
+def _resolve_state(foundation_state) -> SimpleNamespace:
+    """Resolve the foundation data in session state once, preferring the keys the panels write"""
+    hrp1000 = _first_present(foundation_state, 'source_hrp1000', 'hrp1000')
+    hrp1001 = _first_present(foundation_state, 'source_hrp1001', 'hrp1001')
+    hierarchy = foundation_state.get('hierarchy_structure') or foundation_state.get('hierarchy')
+    return SimpleNamespace(
+        hrp1000=hrp1000,
+        hrp1001=hrp1001,
+        hierarchy=hierarchy,
+        hrp1000_loaded=hrp1000 is not None,
+        hrp1001_loaded=hrp1001 is not None,
+        hierarchy_processed=bool(hierarchy),
+        max_level=_hierarchy_max_level(foundation_state, hierarchy),
+        output_generated=bool(foundation_state.get('generated_output_files'))
+    )
+
+def _compute_status(available: bool, statistics_enhanced: bool, validation_enhanced: bool, health_monitor_enhanced: bool,
+                    hrp1000_loaded: bool = False, hrp1001_loaded: bool = False,
+                    hierarchy_processed: bool = False, output_generated: bool = False, max_level: int = 0):
+    """Build the status dict for a combination of availability and progress flags"""
     return {
-        "available": FOUNDATION_AVAILABLE,
+        "available": available,
         "enhanced_features": {
-            "statistics": STATISTICS_ENHANCED,
-            "validation": VALIDATION_ENHANCED, 
-            "health_monitor": HEALTH_MONITOR_ENHANCED
-        }
+            "statistics": statistics_enhanced,
+            "validation": validation_enhanced, 
+            "health_monitor": health_monitor_enhanced
+        },
+        "hrp1000_loaded": hrp1000_loaded,
+        "hrp1001_loaded": hrp1001_loaded,
+        "hierarchy_processed": hierarchy_processed,
+        "output_generated": output_generated,
+        "max_level": max_level
     }
+
+def get_foundation_system_status():
+    """Get foundation system status"""
+    resolved = _resolve_state(st.session_state.get('foundation_state', {}))
+    return _compute_status(
+        FOUNDATION_AVAILABLE,
+        _is_enhanced("statistics"),
+        _is_enhanced("validation"),
+        _is_enhanced("health_monitor"),
+        resolved.hrp1000_loaded,
+        resolved.hrp1001_loaded,
+        resolved.hierarchy_processed,
+        resolved.output_generated,
+        resolved.max_level
+    )
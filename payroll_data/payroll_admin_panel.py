@@ -4,45 +4,123 @@ Provides secure admin configuration for Payroll Data Management
 """
 
 import streamlit as st
-import pandas as pd
+import gzip
 import json
 import os
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from admin_auth import create_payroll_admin
+from config_store import (
+    atomic_write_bytes, clear_config_cache, config_dumps, config_loads, config_path,
+    ensure_dirs, load_all_configs, load_config
+)
+
+# pandas is imported inside the wage type helpers, so the status and settings views load without it
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Configuration directories
 CONFIG_DIR = "payroll_configs"
 TEMPLATE_DIR = "payroll_templates"
 WAGE_TYPE_DIR = "wage_type_configs"
 
+# Config types shown in the status overview and included in backups
+PAYROLL_CONFIG_TYPES = ("wage_types", "validation_rules", "processing_settings")
+# File path of each known config type, joined once at import
+_CONFIG_PATHS = {config_type: config_path(CONFIG_DIR, config_type) for config_type in PAYROLL_CONFIG_TYPES}
+
+# Leading bytes of a gzip stream, used to detect compressed backups
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Columns of a wage type CSV, in download/upload order
+WAGE_TYPE_COLUMNS = ("Wage Type Code", "Name", "Category", "Taxable", "Description")
+# Text columns are read as str so the parser skips type inference and codes keep their leading zeros
+WAGE_TYPE_DTYPES = {"Wage Type Code": str, "Name": str, "Category": str, "Description": str}
+# Allowed wage type categories
+WAGE_TYPE_CATEGORIES = ("regular", "overtime", "premium", "bonus", "benefit", "deduction", "other")
+# Accepted spellings of the Taxable column; anything else is treated as taxable
+_TAXABLE_VALUES = {True: True, False: False, "True": True, "False": False, "true": True, "false": False, "TRUE": True, "FALSE": False}
+
+# Processing settings selectbox options, with option -> position lookups for the default index
+CURRENCY_FORMATS = ("USD", "EUR", "GBP", "CAD", "AUD", "Other")
+DATE_FORMATS = ("YYYY-MM-DD", "MM/DD/YYYY", "DD/MM/YYYY", "DD-MMM-YYYY")
+OUTPUT_FORMATS = ("csv", "excel", "json")
+_CURRENCY_INDEX = {option: i for i, option in enumerate(CURRENCY_FORMATS)}
+_DATE_FORMAT_INDEX = {option: i for i, option in enumerate(DATE_FORMATS)}
+_OUTPUT_FORMAT_INDEX = {option: i for i, option in enumerate(OUTPUT_FORMATS)}
+
 def initialize_payroll_directories():
     """Create required directories if they don't exist"""
-    for directory in [CONFIG_DIR, TEMPLATE_DIR, WAGE_TYPE_DIR]:
-        Path(directory).mkdir(exist_ok=True)
+    return ensure_dirs((CONFIG_DIR, TEMPLATE_DIR, WAGE_TYPE_DIR))
+
+def _file_matches(path: str, data: bytes) -> bool:
+    """True if the file at path already holds exactly these bytes"""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except FileNotFoundError:
+        return False
+
+def write_payroll_configs(configs: Dict[str, Any]) -> int:
+    """Write several configurations atomically, skipping unchanged files; returns how many were written"""
+    written = 0
+    for config_type, config_data in configs.items():
+        path = get_config_path(config_type)
+        payload = config_dumps(config_data)
+        if _file_matches(path, payload):
+            continue
+        atomic_write_bytes(path, payload)
+        written += 1
+    if written:
+        # Drop cached loads so the next rerun reads the new files
+        clear_config_cache()
+    return written
 
 def save_payroll_config(config_type: str, config_data: Any) -> None:
     """Save payroll configuration to file"""
     try:
-        config_path = os.path.join(CONFIG_DIR, f"{config_type}_config.json")
-        with open(config_path, "w") as f:
-            json.dump(config_data, f, indent=2)
+        write_payroll_configs({config_type: config_data})
         st.success(f"✅ {config_type.title()} configuration saved!")
     except Exception as e:
         st.error(f"❌ Error saving config: {str(e)}")
 
+def get_config_path(config_type: str) -> str:
+    """Get the file path for a payroll configuration type"""
+    path = _CONFIG_PATHS.get(config_type)
+    return path if path is not None else config_path(CONFIG_DIR, config_type)
+
 def load_payroll_config(config_type: str) -> Optional[Any]:
     """Load payroll configuration from file"""
     try:
-        config_path = os.path.join(CONFIG_DIR, f"{config_type}_config.json")
-        if not os.path.exists(config_path):
-            return None
-        with open(config_path, "r") as f:
-            return json.load(f)
+        return load_config(CONFIG_DIR, config_type)
     except Exception as e:
         st.error(f"❌ Error loading config: {str(e)}")
         return None
 
+def load_all_payroll_configs() -> Dict[str, Any]:
+    """Load all payroll configurations as {config_type: data}; missing ones are None"""
+    try:
+        configs = load_all_configs(CONFIG_DIR)
+    except Exception as e:
+        st.error(f"❌ Error loading config: {str(e)}")
+        configs = {}
+    return {config_type: configs.get(config_type) for config_type in PAYROLL_CONFIG_TYPES}
+
+def read_wage_type_csv(upload_file, nrows: Optional[int] = None) -> "pd.DataFrame":
+    """Parse an uploaded wage type CSV, with the multithreaded pyarrow engine when it is installed"""
+    import pandas as pd
+    upload_file.seek(0)
+    if nrows is None:
+        try:
+            return pd.read_csv(upload_file, engine="pyarrow", dtype=WAGE_TYPE_DTYPES)
+        except (ImportError, ValueError):
+            # pyarrow missing or unable to parse this file
+            upload_file.seek(0)
+    # The pyarrow engine cannot stop after nrows, so previews always use the C engine
+    return pd.read_csv(upload_file, engine="c", dtype=WAGE_TYPE_DTYPES, low_memory=False, nrows=nrows)
+
 def get_default_wage_types():
     """Get default wage type mappings"""
     return {
@@ -58,15 +136,16 @@ def get_default_wage_types():
         "9000": {"name": "Other Pay", "category": "other", "taxable": True}
     }
 
-def show_payroll_configuration_status():
+def show_payroll_configuration_status(configs: Optional[Dict[str, Any]] = None):
     """Show current payroll configuration status"""
     st.subheader("📋 Payroll Configuration Status")
     st.info("**What this shows:** Current status of your Payroll Data Management configuration")
     
     # Check configurations
-    wage_type_config = load_payroll_config("wage_types")
-    validation_config = load_payroll_config("validation_rules")
-    processing_config = load_payroll_config("processing_settings")
+    configs = configs if configs is not None else load_all_payroll_configs()
+    wage_type_config = configs["wage_types"]
+    validation_config = configs["validation_rules"]
+    processing_config = configs["processing_settings"]
     
     col1, col2, col3 = st.columns(3)
     
@@ -103,36 +182,49 @@ def show_payroll_configuration_status():
     else:
         st.info("ℹ️ **Configuration Not Started** - Using system defaults")
 
-def configure_wage_types():
+@st.cache_data(show_spinner=False)
+def _wage_types_table(wage_types_json: bytes):
+    """Wage type table and its CSV download; the serialized mapping is the cache key"""
+    import pandas as pd
+    # Build the columns straight from the dict of dicts
+    wage_type_df = (
+        pd.DataFrame.from_dict(config_loads(wage_types_json), orient="index")
+        .reindex(columns=["name", "category", "taxable", "description"])
+        .rename_axis("Wage Type Code")
+        .reset_index()
+        .rename(columns={"name": "Name", "category": "Category", "taxable": "Taxable", "description": "Description"})
+        .fillna({"Name": "", "Category": "other", "Taxable": True, "Description": ""})
+    )
+    return wage_type_df, wage_type_df.to_csv(index=False).encode()
+
+def _validate_wage_type_df(df: "pd.DataFrame"):
+    """Sanitize an uploaded wage type table in one vectorized pass; returns (bad row mask, cleaned DataFrame)"""
+    df = df.copy()
+    bad_rows = ~df["Category"].isin(WAGE_TYPE_CATEGORIES)
+    df.loc[bad_rows, "Category"] = "other"
+    if "Taxable" in df.columns:
+        df["Taxable"] = df["Taxable"].map(_TAXABLE_VALUES).fillna(True).astype(bool)
+    return bad_rows, df
+
+def configure_wage_types(configs: Optional[Dict[str, Any]] = None):
     """Configure wage type mappings and categories"""
     st.subheader("💰 Wage Type Configuration")
     st.info("**What this does:** Define how wage types from PA0008 and PA0014 should be interpreted and categorized")
     
     # Load current wage types or use defaults
-    current_wage_types = load_payroll_config("wage_types") or get_default_wage_types()
+    configs = configs if configs is not None else load_all_payroll_configs()
+    current_wage_types = configs["wage_types"] or get_default_wage_types()
     
     st.markdown("### 📋 Current Wage Type Mappings")
     
-    # Convert to DataFrame for easier editing
-    wage_type_rows = []
-    for code, info in current_wage_types.items():
-        wage_type_rows.append({
-            "Wage Type Code": code,
-            "Name": info.get("name", ""),
-            "Category": info.get("category", "other"),
-            "Taxable": info.get("taxable", True),
-            "Description": info.get("description", "")
-        })
-    
     # Show current mappings in editable form
-    if wage_type_rows:
-        wage_type_df = pd.DataFrame(wage_type_rows)
+    if current_wage_types:
+        wage_type_df, csv_data = _wage_types_table(config_dumps(current_wage_types))
         
         # Show current mappings
         st.dataframe(wage_type_df, use_container_width=True)
         
         # Download current mappings
-        csv_data = wage_type_df.to_csv(index=False)
         st.download_button(
             "📥 Download Current Wage Types",
             data=csv_data,
@@ -159,10 +251,9 @@ def configure_wage_types():
         )
     
     with col2:
-        category_options = ["regular", "overtime", "premium", "bonus", "benefit", "deduction", "other"]
         new_category = st.selectbox(
             "Category:",
-            category_options,
+            WAGE_TYPE_CATEGORIES,
             help="Type of wage/deduction"
         )
         
@@ -205,46 +296,61 @@ def configure_wage_types():
     
     if upload_file:
         try:
-            df = pd.read_csv(upload_file)
+            # Only the preview rows are parsed until the import is confirmed
+            preview_df = read_wage_type_csv(upload_file, nrows=5)
             
             # Validate required columns
             required_cols = ["Wage Type Code", "Name", "Category"]
-            if all(col in df.columns for col in required_cols):
+            missing_cols = [col for col in required_cols if col not in preview_df.columns]
+            if missing_cols:
+                st.error(f"❌ Missing required columns: {', '.join(missing_cols)}")
+            else:
                 
                 st.subheader("📋 Preview Upload")
-                st.dataframe(df.head(), use_container_width=True)
+                st.dataframe(preview_df, use_container_width=True)
                 
                 if st.button("📤 Import Wage Types"):
-                    # Convert DataFrame to wage type format
-                    for _, row in df.iterrows():
-                        code = str(row["Wage Type Code"])
-                        current_wage_types[code] = {
-                            "name": row["Name"],
-                            "category": row.get("Category", "other"),
-                            "taxable": row.get("Taxable", True),
-                            "description": row.get("Description", "")
+                    bad_rows, df = _validate_wage_type_df(read_wage_type_csv(upload_file))
+                    
+                    # Convert DataFrame to wage type format in one pass over plain dict records
+                    import_cols = [col for col in WAGE_TYPE_COLUMNS if col in df.columns]
+                    records = df[import_cols].astype({"Wage Type Code": str}).to_dict(orient="records")
+                    current_wage_types.update({
+                        record["Wage Type Code"]: {
+                            "name": record["Name"],
+                            "category": record.get("Category", "other"),
+                            "taxable": record.get("Taxable", True),
+                            "description": record.get("Description", "")
                         }
+                        for record in records
+                    })
                     
                     save_payroll_config("wage_types", current_wage_types)
                     st.success(f"✅ Imported {len(df)} wage types!")
-                    st.rerun()
-            else:
-                st.error(f"❌ Missing required columns: {', '.join(required_cols)}")
+                    if bad_rows.any():
+                        # Keep the report on screen instead of rerunning past it
+                        bad_row_numbers = ", ".join(str(i + 1) for i in bad_rows.to_numpy().nonzero()[0])
+                        st.warning(f"⚠️ Unknown category in rows {bad_row_numbers} - imported as 'other'")
+                    else:
+                        st.rerun()
                 
         except Exception as e:
             st.error(f"❌ Error reading file: {str(e)}")
 
-def configure_validation_rules():
+def configure_validation_rules(configs: Optional[Dict[str, Any]] = None):
     """Configure payroll validation rules"""
     st.subheader("✅ Payroll Validation Rules")
     st.info("**What this does:** Set up validation rules to ensure payroll data quality and catch errors")
     
     # Load current validation rules
-    current_rules = load_payroll_config("validation_rules") or {
+    configs = configs if configs is not None else load_all_payroll_configs()
+    current_rules = configs["validation_rules"] or {
         "rules": [],
         "thresholds": {},
         "alerts": {}
     }
+    thresholds = current_rules.get("thresholds", {})
+    alerts = current_rules.get("alerts", {})
     
     st.markdown("### 🎯 Amount Validation Thresholds")
     
@@ -254,14 +360,14 @@ def configure_validation_rules():
         max_regular_pay = st.number_input(
             "Maximum Regular Pay per Period:",
             min_value=0.0,
-            value=current_rules.get("thresholds", {}).get("max_regular_pay", 50000.0),
+            value=thresholds.get("max_regular_pay", 50000.0),
             help="Alert if regular pay exceeds this amount"
         )
         
         max_overtime_hours = st.number_input(
             "Maximum Overtime Hours:",
             min_value=0.0,
-            value=current_rules.get("thresholds", {}).get("max_overtime_hours", 80.0),
+            value=thresholds.get("max_overtime_hours", 80.0),
             help="Alert if overtime hours exceed this limit"
         )
     
@@ -269,7 +375,7 @@ def configure_validation_rules():
         min_wage_rate = st.number_input(
             "Minimum Wage Rate:",
             min_value=0.0,
-            value=current_rules.get("thresholds", {}).get("min_wage_rate", 7.25),
+            value=thresholds.get("min_wage_rate", 7.25),
             help="Alert if wage rate is below minimum"
         )
         
@@ -277,7 +383,7 @@ def configure_validation_rules():
             "Maximum Deduction Percentage:",
             min_value=0.0,
             max_value=100.0,
-            value=current_rules.get("thresholds", {}).get("max_deduction_percent", 50.0),
+            value=thresholds.get("max_deduction_percent", 50.0),
             help="Alert if total deductions exceed this % of pay"
         )
     
@@ -286,13 +392,13 @@ def configure_validation_rules():
     
     validate_pay_periods = st.checkbox(
         "Validate Pay Period Dates",
-        value=current_rules.get("alerts", {}).get("validate_pay_periods", True),
+        value=alerts.get("validate_pay_periods", True),
         help="Check that pay periods are logical and sequential"
     )
     
     check_future_dates = st.checkbox(
         "Alert on Future Dates",
-        value=current_rules.get("alerts", {}).get("check_future_dates", True),
+        value=alerts.get("check_future_dates", True),
         help="Warn about payments dated in the future"
     )
     
@@ -301,13 +407,13 @@ def configure_validation_rules():
     
     require_employee_match = st.checkbox(
         "Require Employee ID Match",
-        value=current_rules.get("alerts", {}).get("require_employee_match", True),
+        value=alerts.get("require_employee_match", True),
         help="Ensure all payroll records have valid employee IDs"
     )
     
     check_duplicate_payments = st.checkbox(
         "Check for Duplicate Payments",
-        value=current_rules.get("alerts", {}).get("check_duplicate_payments", True),
+        value=alerts.get("check_duplicate_payments", True),
         help="Alert on potential duplicate payment records"
     )
     
@@ -324,7 +430,7 @@ def configure_validation_rules():
     # Save validation rules
     if st.button("💾 Save Validation Rules", type="primary"):
         try:
-            custom_rules_data = json.loads(custom_rules) if custom_rules.strip() else {}
+            custom_rules_data = config_loads(custom_rules) if custom_rules.strip() else {}
             
             validation_data = {
                 "thresholds": {
@@ -340,7 +446,7 @@ def configure_validation_rules():
                     "check_duplicate_payments": check_duplicate_payments
                 },
                 "custom_rules": custom_rules_data,
-                "updated": pd.Timestamp.now().isoformat()
+                "updated": datetime.now().isoformat()
             }
             
             save_payroll_config("validation_rules", validation_data)
@@ -354,13 +460,14 @@ def configure_validation_rules():
         except Exception as e:
             st.error(f"❌ Error saving validation rules: {str(e)}")
 
-def configure_processing_settings():
+def configure_processing_settings(configs: Optional[Dict[str, Any]] = None):
     """Configure payroll processing settings"""
     st.subheader("⚙️ Payroll Processing Settings")
     st.info("**What this does:** Configure how PA0008 and PA0014 files are processed and analyzed")
     
     # Load current settings
-    current_settings = load_payroll_config("processing_settings") or {
+    configs = configs if configs is not None else load_all_payroll_configs()
+    current_settings = configs["processing_settings"] or {
         "batch_size": 5000,
         "currency_format": "USD",
         "decimal_places": 2,
@@ -411,8 +518,8 @@ def configure_processing_settings():
     with col1:
         currency_format = st.selectbox(
             "Currency Format:",
-            ["USD", "EUR", "GBP", "CAD", "AUD", "Other"],
-            index=["USD", "EUR", "GBP", "CAD", "AUD", "Other"].index(current_settings.get("currency_format", "USD")),
+            CURRENCY_FORMATS,
+            index=_CURRENCY_INDEX.get(current_settings.get("currency_format", "USD"), 0),
             help="Default currency for amount formatting"
         )
         
@@ -427,8 +534,8 @@ def configure_processing_settings():
     with col2:
         date_format = st.selectbox(
             "Date Format:",
-            ["YYYY-MM-DD", "MM/DD/YYYY", "DD/MM/YYYY", "DD-MMM-YYYY"],
-            index=["YYYY-MM-DD", "MM/DD/YYYY", "DD/MM/YYYY", "DD-MMM-YYYY"].index(current_settings.get("date_format", "YYYY-MM-DD")),
+            DATE_FORMATS,
+            index=_DATE_FORMAT_INDEX.get(current_settings.get("date_format", "YYYY-MM-DD"), 0),
             help="Format for date fields in output"
         )
         
@@ -464,8 +571,8 @@ def configure_processing_settings():
     
     output_format = st.selectbox(
         "Output File Format:",
-        ["csv", "excel", "json"],
-        index=["csv", "excel", "json"].index(current_settings.get("output_format", "csv")),
+        OUTPUT_FORMATS,
+        index=_OUTPUT_FORMAT_INDEX.get(current_settings.get("output_format", "csv"), 0),
         help="Format for generated payroll files"
     )
     
@@ -491,7 +598,7 @@ def configure_processing_settings():
             "calculate_totals": calculate_totals,
             "output_format": output_format,
             "include_analytics": include_analytics,
-            "updated": pd.Timestamp.now().isoformat()
+            "updated": datetime.now().isoformat()
         }
         
         save_payroll_config("processing_settings", settings_data)
@@ -500,7 +607,7 @@ def configure_processing_settings():
         st.subheader("✅ Settings Preview")
         st.json(settings_data)
 
-def system_maintenance():
+def system_maintenance(configs: Optional[Dict[str, Any]] = None):
     """System maintenance and cleanup tools"""
     st.subheader("🔧 Payroll System Maintenance")
     st.info("**What this does:** Maintenance tools for the Payroll Data Management system")
@@ -515,21 +622,22 @@ def system_maintenance():
         if st.button("📦 Create Payroll Backup"):
             try:
                 # Collect all configurations
+                configs = configs if configs is not None else load_all_payroll_configs()
                 backup_data = {
-                    "wage_types": load_payroll_config("wage_types"),
-                    "validation_rules": load_payroll_config("validation_rules"),
-                    "processing_settings": load_payroll_config("processing_settings"),
-                    "backup_timestamp": pd.Timestamp.now().isoformat(),
+                    "wage_types": configs["wage_types"],
+                    "validation_rules": configs["validation_rules"],
+                    "processing_settings": configs["processing_settings"],
+                    "backup_timestamp": datetime.now().isoformat(),
                     "system": "payroll"
                 }
                 
-                # Create downloadable backup
-                backup_json = json.dumps(backup_data, indent=2)
+                # Create downloadable backup, gzipped since wage type tables compress well
+                backup_payload = gzip.compress(config_dumps(backup_data), compresslevel=6)
                 st.download_button(
                     "📥 Download Payroll Backup",
-                    data=backup_json,
-                    file_name=f"payroll_config_backup_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json"
+                    data=backup_payload,
+                    file_name=f"payroll_config_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json.gz",
+                    mime="application/gzip"
                 )
                 st.success("✅ Payroll backup created successfully!")
                 
@@ -540,24 +648,32 @@ def system_maintenance():
         st.markdown("**📤 Restore Configuration**")
         restore_file = st.file_uploader(
             "Upload Payroll Backup:",
-            type=['json'],
-            help="Select a payroll configuration backup file"
+            type=['json', 'gz'],
+            help="Select a payroll configuration backup file (.json or .json.gz)"
         )
         
         if restore_file and st.button("🔄 Restore Payroll Config"):
             try:
-                backup_data = json.load(restore_file)
+                backup_bytes = restore_file.getvalue()
+                # Older backups are plain JSON; newer ones are gzipped
+                if backup_bytes[:2] == GZIP_MAGIC:
+                    backup_bytes = gzip.decompress(backup_bytes)
+                backup_data = config_loads(backup_bytes)
                 
                 # Verify it's a payroll backup
                 if backup_data.get("system") != "payroll":
                     st.warning("⚠️ This doesn't appear to be a payroll backup file")
                 
-                # Restore each configuration
-                for config_type, config_data in backup_data.items():
-                    if config_type not in ["backup_timestamp", "system"] and config_data:
-                        save_payroll_config(config_type, config_data)
+                # Collect the configurations first, then write them in one batch
+                configs_to_restore = {
+                    config_type: config_data
+                    for config_type, config_data in backup_data.items()
+                    if config_type not in ("backup_timestamp", "system") and config_data
+                }
+                write_payroll_configs(configs_to_restore)
                 
-                st.success("✅ Payroll configuration restored successfully!")
+                restored = ", ".join(config_type.replace("_", " ") for config_type in configs_to_restore)
+                st.success(f"✅ Payroll configuration restored successfully! ({restored or 'nothing to restore'})")
                 st.info("Please refresh the page to see restored settings")
                 
             except Exception as e:
@@ -581,84 +697,90 @@ def system_maintenance():
             st.warning("This will delete all payroll configuration files!")
             if st.checkbox("I understand this cannot be undone", key="payroll_reset_confirm"):
                 try:
-                    # Remove configuration files
-                    for config_file in Path(CONFIG_DIR).glob("*.json"):
-                        config_file.unlink()
+                    # Remove configuration files; DirEntry carries the file type, so each entry is not stat'ed again
+                    with os.scandir(CONFIG_DIR) as entries:
+                        for entry in entries:
+                            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                                os.unlink(entry.path)
+                    clear_config_cache()
                     st.success("✅ All payroll configurations reset!")
                 except Exception as e:
                     st.error(f"❌ Error resetting: {str(e)}")
 
-def show_payroll_admin_panel():
-    """Main payroll admin panel with authentication"""
-    auth = create_payroll_admin()
-    
-    def payroll_admin_content():
-        # Clean header
-        st.markdown("""
-        <div style="background: linear-gradient(90deg, #dc2626 0%, #ef4444 100%); 
-                    color: white; padding: 2rem; border-radius: 10px; margin-bottom: 2rem;">
-            <h1 style="margin: 0; font-size: 2.5rem;">💰 Payroll Configuration Center</h1>
-            <p style="margin: 0.5rem 0 0 0; font-size: 1.2rem; opacity: 0.9;">
-                Configure how your PA0008 & PA0014 files are processed for payroll analysis
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Initialize directories
-        initialize_payroll_directories()
-        
-        # Configuration status at top
-        show_payroll_configuration_status()
-        
-        st.markdown("---")
-        
-        # Main tabs
-        tabs = st.tabs([
-            "💰 Wage Types",
-            "✅ Validation Rules",
-            "⚙️ Processing Settings",
-            "🔧 System Maintenance"
-        ])
-        
-        with tabs[0]:
-            configure_wage_types()
+# Static page header and help text, built once at import
+_HEADER_HTML = """
+    <div style="background: linear-gradient(90deg, #dc2626 0%, #ef4444 100%); 
+                color: white; padding: 2rem; border-radius: 10px; margin-bottom: 2rem;">
+        <h1 style="margin: 0; font-size: 2.5rem;">💰 Payroll Configuration Center</h1>
+        <p style="margin: 0.5rem 0 0 0; font-size: 1.2rem; opacity: 0.9;">
+            Configure how your PA0008 & PA0014 files are processed for payroll analysis
+        </p>
+    </div>
+    """
+
+_HELP_MD = """
+        **Payroll Configuration Overview:**
         
-        with tabs[1]:
-            configure_validation_rules()
+        💰 **Wage Types:** Define how wage type codes are interpreted and categorized
+        ✅ **Validation Rules:** Set thresholds and checks for data quality
+        ⚙️ **Processing Settings:** Control performance, formatting, and output options
+        🔧 **System Maintenance:** Backup/restore configurations and system cleanup
         
-        with tabs[2]:
-            configure_processing_settings()
+        **Important Files:**
+        - **PA0008:** Contains basic pay information (salary, hourly rates)
+        - **PA0014:** Contains recurring payments and deductions
         
-        with tabs[3]:
-            system_maintenance()
+        **Common Tasks:**
+        1. **Map Wage Types:** Define what each 4-digit wage type code means
+        2. **Set Validation Thresholds:** Configure alerts for unusual amounts
+        3. **Configure Processing:** Set batch sizes and output formats
+        4. **Backup Settings:** Save your configuration before making changes
         
-        # Help section
-        st.markdown("---")
-        with st.expander("❓ Payroll Configuration Help", expanded=False):
-            st.markdown("""
-            **Payroll Configuration Overview:**
-            
-            💰 **Wage Types:** Define how wage type codes are interpreted and categorized
-            ✅ **Validation Rules:** Set thresholds and checks for data quality
-            ⚙️ **Processing Settings:** Control performance, formatting, and output options
-            🔧 **System Maintenance:** Backup/restore configurations and system cleanup
-            
-            **Important Files:**
-            - **PA0008:** Contains basic pay information (salary, hourly rates)
-            - **PA0014:** Contains recurring payments and deductions
-            
-            **Common Tasks:**
-            1. **Map Wage Types:** Define what each 4-digit wage type code means
-            2. **Set Validation Thresholds:** Configure alerts for unusual amounts
-            3. **Configure Processing:** Set batch sizes and output formats
-            4. **Backup Settings:** Save your configuration before making changes
-            
-            **Tips:**
-            - Start by mapping the most common wage types in your data
-            - Set realistic validation thresholds based on your payroll ranges
-            - Use bulk upload for large wage type lists
-            - Regular backups prevent configuration loss
-            """)
-    
-    # Apply authentication wrapper
-    auth.require_auth(payroll_admin_content)
+        **Tips:**
+        - Start by mapping the most common wage types in your data
+        - Set realistic validation thresholds based on your payroll ranges
+        - Use bulk upload for large wage type lists
+        - Regular backups prevent configuration loss
+        """
+
+@create_payroll_admin().require_auth
+def show_payroll_admin_panel():
+    """Main payroll admin panel with authentication"""
+    # Clean header
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+    
+    # Initialize directories
+    initialize_payroll_directories()
+    
+    # Read every config once and share the snapshot with the status and all tabs
+    configs = load_all_payroll_configs()
+    
+    # Configuration status at top
+    show_payroll_configuration_status(configs)
+    
+    st.markdown("---")
+    
+    # Main tabs
+    tabs = st.tabs([
+        "💰 Wage Types",
+        "✅ Validation Rules",
+        "⚙️ Processing Settings",
+        "🔧 System Maintenance"
+    ])
+    
+    with tabs[0]:
+        configure_wage_types(configs)
+    
+    with tabs[1]:
+        configure_validation_rules(configs)
+    
+    with tabs[2]:
+        configure_processing_settings(configs)
+    
+    with tabs[3]:
+        system_maintenance(configs)
+    
+    # Help section
+    st.markdown("---")
+    with st.expander("❓ Payroll Configuration Help", expanded=False):
+        st.markdown(_HELP_MD)
@@ -524,6 +524,7 @@ def show_payroll_panel(state):
                                 
                                 # Save to state
                                 state[f'source_{file_key.lower()}'] = df
+                                state[f'source_{file_key.lower()}_rows'] = len(df)
                                 st.success(f"✅ {file_key}: {len(df):,} records processed")
                                 success_count += 1
                                 
@@ -543,6 +544,7 @@ def show_payroll_panel(state):
                 for file_key in ['PA0008', 'PA0014']:
                     if f'source_{file_key.lower()}' in state:
                         del state[f'source_{file_key.lower()}']
+                    state.pop(f'source_{file_key.lower()}_rows', None)
                 if 'generated_payroll_files' in state:
                     del state['generated_payroll_files']
                 # Clear cached data too
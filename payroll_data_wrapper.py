@@ -3,144 +3,190 @@ Payroll Data Management Wrapper
 This file provides a clean interface between the main app and the payroll data management system
 """
 
+import importlib
+import importlib.util
 import os
 import sys
 import streamlit as st
 
-# Add the payroll paths - try multiple locations
+# Payroll panel locations
 current_dir = os.path.dirname(__file__)
 payroll_data_path = os.path.join(current_dir, 'payroll_data')  # Your new payroll system
 payroll_path = os.path.join(current_dir, 'payroll')  # Your old payroll system
 payroll_panels_path = os.path.join(current_dir, 'payroll_panels')
 
-# Add paths to sys.path if they don't exist
-paths_to_add = [payroll_data_path, payroll_path, payroll_panels_path]
-for path in paths_to_add:
-    if os.path.exists(path) and path not in sys.path:
-        sys.path.insert(0, path)
+# Panel name -> (module, show function)
+PAYROLL_PANELS = {
+    "main": ("payroll_main_panel", "show_payroll_panel"),
+    "statistics": ("payroll_statistics_panel", "show_payroll_statistics_panel"),
+    "validation": ("payroll_validation_panel", "show_payroll_validation_panel"),
+    "dashboard": ("payroll_dashboard_panel", "show_payroll_dashboard_panel"),
+    "admin": ("payroll_admin_panel", "show_payroll_admin_panel")
+}
+
+# Panel directories in priority order: NEW system first, then the OLD payroll/ fallback
+PAYROLL_PANEL_DIRS = (payroll_data_path, payroll_path, payroll_panels_path)
+# First panel directory that exists, resolved once at import (None: rely on the current sys.path)
+_resolved_payroll_dir = next((path for path in PAYROLL_PANEL_DIRS if os.path.isdir(path)), None)
 
-# Import the payroll data management panels - try multiple import strategies
-PAYROLL_DATA_AVAILABLE = False
 import_error_messages = []
 
-# Strategy 1: Import from payroll_data directory (NEW SYSTEM - PRIORITY)
-try:
-    sys.path.insert(0, payroll_data_path)
-    from payroll_main_panel import show_payroll_panel
-    from payroll_statistics_panel import show_payroll_statistics_panel  
-    from payroll_validation_panel import show_payroll_validation_panel
-    from payroll_dashboard_panel import show_payroll_dashboard_panel
-    from payroll_admin_panel import show_payroll_admin_panel
-    PAYROLL_DATA_AVAILABLE = True
-    print("✅ Payroll panels imported successfully (from payroll_data/)")
-except ImportError as e:
-    import_error_messages.append(f"Payroll_data directory import failed: {e}")
+def _probe_panels() -> bool:
+    """Put the resolved panel directory on sys.path and check every panel module can be found, without importing it"""
+    panel_dir = _resolved_payroll_dir
+    inserted = panel_dir is not None and panel_dir not in sys.path
+    if inserted:
+        sys.path.insert(0, panel_dir)
+    
+    missing = [module for module, _ in PAYROLL_PANELS.values() if importlib.util.find_spec(module) is None]
+    if missing:
+        # Leave sys.path as it was so later imports don't scan a useless entry
+        if inserted:
+            sys.path.remove(panel_dir)
+        import_error_messages.append(f"Modules not found in {panel_dir or 'current path'}: {', '.join(missing)}")
+        print(f"❌ Payroll panels not available: {import_error_messages[-1]}")
+        return False
+    return True
+
+def cached_import(module_name: str, attr: str):
+    """Return an attribute of a module, going through the import machinery only if it is not in sys.modules yet"""
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return getattr(module, attr)
+
+@st.cache_resource(show_spinner=False)
+def _get_panel(name: str):
+    """Return the show function of a payroll panel, importing its module on first use; cached across reruns"""
+    return cached_import(*PAYROLL_PANELS[name])
+
+PAYROLL_DATA_AVAILABLE = _probe_panels()
+
+_TROUBLESHOOTING_MD = """
+**Common issues:**
+1. Make sure the payroll panel files exist in one of these locations:
+   - `payroll_data/` directory (NEW system - primary location)
+   - `payroll/` directory (OLD system - fallback)
+   - `payroll_panels/` directory (alternative location)
+   - Current directory
+2. Check that all panel files exist:
+   - payroll_main_panel.py
+   - payroll_statistics_panel.py
+   - payroll_validation_panel.py
+   - payroll_dashboard_panel.py
+   - payroll_admin_panel.py
+3. Verify your folder structure matches one of these:
+
+**Option 1 - NEW system in payroll_data directory (RECOMMENDED):**
+```
+your_project/
+├── app.py
+├── payroll_data_wrapper.py
+├── payroll/
+│   └── (your OLD payroll system)
+└── payroll_data/
+    ├── payroll_main_panel.py
+    ├── payroll_statistics_panel.py
+    ├── payroll_validation_panel.py
+    ├── payroll_dashboard_panel.py
+    ├── payroll_admin_panel.py
+    ├── payroll_configs/
+    └── payroll_picklists/
+```
+
+**Option 2 - Panels in payroll directory:**
+```
+your_project/
+├── app.py
+├── payroll_data_wrapper.py
+└── payroll/
+    ├── payroll_main_panel.py
+    ├── payroll_statistics_panel.py
+    ├── payroll_validation_panel.py
+    ├── payroll_dashboard_panel.py
+    ├── payroll_admin_panel.py
+    ├── payroll_configs/
+    └── payroll_picklists/
+```
+"""
+
+# Panel selector label -> (panel name, about title, about text, spinner text)
+PANEL_DISPATCH = {
+    "🏠 Payroll Processing": ("main", "Payroll Processing", """
+    **Payroll Processing Panel** handles:
+    - Upload and processing of PA0008 (Basic Pay) and PA0014 (Recurring Payments/Deductions) files
+    - Wage type mapping and transformation
+    - Generation of SuccessFactors-ready payroll output files
+    - Preview and validation of processed payroll data
+    """, None),
+    "📊 Statistics & Analytics": ("statistics", "Statistics & Analytics", """
+    **Statistics & Analytics Panel** provides:
+    - Comprehensive payroll data analysis and insights
+    - Wage type distribution and trends
+    - Payment pattern analysis
+    - Data quality assessment for payroll records
+    """, "Loading payroll statistics..."),
+    "✅ Data Validation": ("validation", "Data Validation", """
+    **Data Validation Panel** performs:
+    - Comprehensive payroll data quality checks
+    - Wage type validation and business rule verification
+    - Payment amount and currency validation
+    - Error reporting and remediation guidance for payroll data
+    """, "Running payroll validation checks..."),
+    "📈 Dashboard": ("dashboard", "Dashboard", """
+    **Dashboard Panel** displays:
+    - Real-time payroll migration progress
+    - Key payroll performance indicators
+    - Visual payroll data summaries
+    - Migration status overview for payroll components
+    """, None),
+    "⚙️ Admin Configuration": ("admin", "Admin Configuration", """
+    **Admin Configuration Panel** manages:
+    - Payroll system settings and preferences
+    - Wage type mapping configurations
+    - Payroll business rules setup
+    - Advanced payroll processing parameters
+    """, None)
+}
+
+# Static header and footer, each sent as a single markdown element
+_HEADER_MD = """### Employee Data – Payroll
+
+*Advanced processing, validation, and analytics for SAP HCM → SuccessFactors payroll migration*"""
+
+_FOOTER_MD = """
+---
+
+**💡 Tips for Payroll Success:**
 
-# Strategy 2: Direct import (panels in current directory or already in path)
-if not PAYROLL_DATA_AVAILABLE:
-    try:
-        from payroll_main_panel import show_payroll_panel
-        from payroll_statistics_panel import show_payroll_statistics_panel  
-        from payroll_validation_panel import show_payroll_validation_panel
-        from payroll_dashboard_panel import show_payroll_dashboard_panel
-        from payroll_admin_panel import show_payroll_admin_panel
-        PAYROLL_DATA_AVAILABLE = True
-        print("✅ Payroll panels imported successfully (direct)")
-    except ImportError as e:
-        import_error_messages.append(f"Direct import failed: {e}")
+1. **Start with Processing:** Upload PA0008 & PA0014 files and generate payroll output first
+2. **Validate Early:** Run validation checks to catch payroll issues before final migration
+3. **Monitor Progress:** Use the dashboard to track your payroll migration status
+4. **Analyze Wage Types:** Use statistics panel to understand wage type distribution and patterns
+"""
 
-# Strategy 3: Import from payroll directory (OLD SYSTEM - FALLBACK)
-if not PAYROLL_DATA_AVAILABLE:
-    try:
-        sys.path.insert(0, payroll_path)
-        from payroll_main_panel import show_payroll_panel
-        from payroll_statistics_panel import show_payroll_statistics_panel  
-        from payroll_validation_panel import show_payroll_validation_panel
-        from payroll_dashboard_panel import show_payroll_dashboard_panel
-        from payroll_admin_panel import show_payroll_admin_panel
-        PAYROLL_DATA_AVAILABLE = True
-        print("✅ Payroll panels imported successfully (from payroll/ - fallback)")
-    except ImportError as e:
-        import_error_messages.append(f"Payroll directory import failed: {e}")
+# Session state keys of the PA source files
+_PA_STATE_KEYS = ('source_pa0008', 'source_pa0014')
 
-# Strategy 4: Import from payroll_panels directory
-if not PAYROLL_DATA_AVAILABLE:
-    try:
-        sys.path.insert(0, payroll_panels_path)
-        from payroll_main_panel import show_payroll_panel
-        from payroll_statistics_panel import show_payroll_statistics_panel  
-        from payroll_validation_panel import show_payroll_validation_panel
-        from payroll_dashboard_panel import show_payroll_dashboard_panel
-        from payroll_admin_panel import show_payroll_admin_panel
-        PAYROLL_DATA_AVAILABLE = True
-        print("✅ Payroll panels imported successfully (from payroll_panels/)")
-    except ImportError as e:
-        import_error_messages.append(f"Payroll panels directory import failed: {e}")
+def _count_pa_files(payroll_state) -> int:
+    """Count the PA source files loaded into the payroll state"""
+    return sum(1 for key in _PA_STATE_KEYS if payroll_state.get(key) is not None)
 
-if not PAYROLL_DATA_AVAILABLE:
-    print(f"❌ All payroll import strategies failed:")
-    for msg in import_error_messages:
-        print(f"  - {msg}")
+def _render_unavailable():
+    """Explain why the payroll system could not be loaded"""
+    st.error("❌ Payroll Data Management system not available.")
+    with st.expander("🔍 Troubleshooting", expanded=False):
+        st.markdown(_TROUBLESHOOTING_MD)
+        
+        # Show detailed error information
+        st.markdown("**Import Error Details:**")
+        for i, msg in enumerate(import_error_messages, 1):
+            st.code(f"{i}. {msg}")
 
 def render_payroll_data_management():
     """Render the complete payroll data management system"""
     if not PAYROLL_DATA_AVAILABLE:
-        st.error("❌ Payroll Data Management system not available.")
-        with st.expander("🔍 Troubleshooting", expanded=False):
-            st.markdown("""
-            **Common issues:**
-            1. Make sure the payroll panel files exist in one of these locations:
-               - `payroll_data/` directory (NEW system - primary location)
-               - `payroll/` directory (OLD system - fallback)
-               - `payroll_panels/` directory (alternative location)
-               - Current directory
-            2. Check that all panel files exist:
-               - payroll_main_panel.py
-               - payroll_statistics_panel.py
-               - payroll_validation_panel.py
-               - payroll_dashboard_panel.py
-               - payroll_admin_panel.py
-            3. Verify your folder structure matches one of these:
-            
-            **Option 1 - NEW system in payroll_data directory (RECOMMENDED):**
-            ```
-            your_project/
-            ├── app.py
-            ├── payroll_data_wrapper.py
-            ├── payroll/
-            │   └── (your OLD payroll system)
-            └── payroll_data/
-                ├── payroll_main_panel.py
-                ├── payroll_statistics_panel.py
-                ├── payroll_validation_panel.py
-                ├── payroll_dashboard_panel.py
-                ├── payroll_admin_panel.py
-                ├── payroll_configs/
-                └── payroll_picklists/
-            ```
-            
-            **Option 2 - Panels in payroll directory:**
-            ```
-            your_project/
-            ├── app.py
-            ├── payroll_data_wrapper.py
-            └── payroll/
-                ├── payroll_main_panel.py
-                ├── payroll_statistics_panel.py
-                ├── payroll_validation_panel.py
-                ├── payroll_dashboard_panel.py
-                ├── payroll_admin_panel.py
-                ├── payroll_configs/
-                └── payroll_picklists/
-            ```
-            """)
-            
-            # Show detailed error information
-            st.markdown("**Import Error Details:**")
-            for i, msg in enumerate(import_error_messages, 1):
-                st.code(f"{i}. {msg}")
-                
-        return
+        return _render_unavailable()
     
     # Initialize payroll session state if not exists
     if 'payroll_state' not in st.session_state:
@@ -150,34 +196,26 @@ def render_payroll_data_management():
     
     # Create a container for the payroll management system
     with st.container():
-        st.markdown("### Employee Data – Payroll")
-        st.markdown("*Advanced processing, validation, and analytics for SAP HCM → SuccessFactors payroll migration*")
+        st.markdown(_HEADER_MD)
         
         # Navigation for payroll panels
         panel_choice = st.selectbox(
             "**Choose Panel:**",
-            [
-                "🏠 Payroll Processing",
-                "📊 Statistics & Analytics", 
-                "✅ Data Validation",
-                "📈 Dashboard",
-                "⚙️ Admin Configuration"
-            ],
+            tuple(PANEL_DISPATCH),
             key="payroll_panel_selection",
             help="Select the payroll panel you want to work with"
         )
         
         # Show quick status in columns
+        pa_files_loaded = _count_pa_files(payroll_state)
         st.markdown("#### 📋 Quick Status")
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            pa_files_loaded = sum(1 for file_key in ['PA0008', 'PA0014'] 
-                                 if payroll_state.get(f'source_{file_key.lower()}') is not None)
             st.metric("📂 PA Files", f"{pa_files_loaded}/2", help="PA0008 & PA0014 files loaded for payroll processing")
         
         with col2:
-            output_generated = 'generated_payroll_files' in payroll_state and payroll_state['generated_payroll_files']
+            output_generated = payroll_state.get('generated_payroll_files')
             st.metric("📤 Output", "✅ Ready" if output_generated else "❌ Pending", help="Payroll output file generation status")
         
         with col3:
@@ -199,67 +237,22 @@ def render_payroll_data_management():
         
         # Show selected panel
         try:
-            if panel_choice == "🏠 Payroll Processing":
-                with st.expander("ℹ️ About Payroll Processing", expanded=False):
-                    st.markdown("""
-                    **Payroll Processing Panel** handles:
-                    - Upload and processing of PA0008 (Basic Pay) and PA0014 (Recurring Payments/Deductions) files
-                    - Wage type mapping and transformation
-                    - Generation of SuccessFactors-ready payroll output files
-                    - Preview and validation of processed payroll data
-                    """)
-                show_payroll_panel(payroll_state)
-                
-            elif panel_choice == "📊 Statistics & Analytics":
-                with st.expander("ℹ️ About Statistics & Analytics", expanded=False):
-                    st.markdown("""
-                    **Statistics & Analytics Panel** provides:
-                    - Comprehensive payroll data analysis and insights
-                    - Wage type distribution and trends
-                    - Payment pattern analysis
-                    - Data quality assessment for payroll records
-                    """)
+            panel_name, about_title, about_text, spinner_text = PANEL_DISPATCH[panel_choice]
+            with st.expander(f"ℹ️ About {about_title}", expanded=False):
+                st.markdown(about_text)
+            
+            if panel_name == "statistics":
                 # Add warning for large datasets
-                pa0008_data = payroll_state.get('source_pa0008')
-                if pa0008_data is not None and len(pa0008_data) > 10000:
+                if payroll_state.get('source_pa0008_rows', 0) > 10000:
                     st.warning("⚠️ Large payroll dataset detected. Statistics panel may take a moment to load...")
-                
-                with st.spinner("Loading payroll statistics..."):
-                    show_payroll_statistics_panel(payroll_state)
-                    
-            elif panel_choice == "✅ Data Validation":
-                with st.expander("ℹ️ About Data Validation", expanded=False):
-                    st.markdown("""
-                    **Data Validation Panel** performs:
-                    - Comprehensive payroll data quality checks
-                    - Wage type validation and business rule verification
-                    - Payment amount and currency validation
-                    - Error reporting and remediation guidance for payroll data
-                    """)
-                with st.spinner("Running payroll validation checks..."):
-                    show_payroll_validation_panel(payroll_state)
-                    
-            elif panel_choice == "📈 Dashboard":
-                with st.expander("ℹ️ About Dashboard", expanded=False):
-                    st.markdown("""
-                    **Dashboard Panel** displays:
-                    - Real-time payroll migration progress
-                    - Key payroll performance indicators
-                    - Visual payroll data summaries
-                    - Migration status overview for payroll components
-                    """)
-                show_payroll_dashboard_panel(payroll_state)
-                
-            elif panel_choice == "⚙️ Admin Configuration":
-                with st.expander("ℹ️ About Admin Configuration", expanded=False):
-                    st.markdown("""
-                    **Admin Configuration Panel** manages:
-                    - Payroll system settings and preferences
-                    - Wage type mapping configurations
-                    - Payroll business rules setup
-                    - Advanced payroll processing parameters
-                    """)
-                show_payroll_admin_panel()
+            
+            show_panel = _get_panel(panel_name)
+            panel_args = () if panel_name == "admin" else (payroll_state,)
+            if spinner_text:
+                with st.spinner(spinner_text):
+                    show_panel(*panel_args)
+            else:
+                show_panel(*panel_args)
 
         except Exception as e:
             st.error(f"❌ **Panel Error:** {str(e)}")
@@ -274,17 +267,23 @@ def render_payroll_data_management():
                     st.rerun()
                     
         # Footer with helpful information
-        st.markdown("---")
-        st.markdown("**💡 Tips for Payroll Success:**")
-        st.markdown("""
-        1. **Start with Processing:** Upload PA0008 & PA0014 files and generate payroll output first
-        2. **Validate Early:** Run validation checks to catch payroll issues before final migration
-        3. **Monitor Progress:** Use the dashboard to track your payroll migration status
-        4. **Analyze Wage Types:** Use statistics panel to understand wage type distribution and patterns
-        """)
+        st.markdown(_FOOTER_MD)
+
+def _status_inputs(payroll_state) -> tuple:
+    """State entries the status is built from; the objects themselves are kept so a replaced one is detected with is"""
+    return (
+        payroll_state.get('source_pa0008'),
+        payroll_state.get('source_pa0014'),
+        payroll_state.get('generated_payroll_files'),
+        payroll_state.get('wage_types_processed', 0)
+    )
+
+def _same_inputs(cached: tuple, current: tuple) -> bool:
+    """Same entry objects (compared by identity) and the same processed wage type count"""
+    return all(a is b for a, b in zip(cached[:3], current[:3])) and cached[3] == current[3]
 
 def get_payroll_system_status():
-    """Get current status of the payroll data management system"""
+    """Get current status of the payroll data management system, reusing the last result while its inputs are unchanged"""
     if not PAYROLL_DATA_AVAILABLE:
         return {"available": False, "error": "Modules not loaded"}
     
@@ -292,10 +291,14 @@ def get_payroll_system_status():
         return {"available": True, "initialized": False}
     
     payroll_state = st.session_state.payroll_state
-    pa_files_loaded = sum(1 for file_key in ['PA0008', 'PA0014'] 
-                         if payroll_state.get(f'source_{file_key.lower()}') is not None)
+    inputs = _status_inputs(payroll_state)
+    cache = payroll_state.get('_status_cache')
+    if cache is not None and _same_inputs(cache[0], inputs):
+        return cache[1]
+    
+    pa_files_loaded = _count_pa_files(payroll_state)
     
-    return {
+    status = {
         "available": True,
         "initialized": True,
         "pa_files_loaded": pa_files_loaded,
@@ -303,3 +306,5 @@ def get_payroll_system_status():
         "output_generated": payroll_state.get('generated_payroll_files', False),
         "wage_types_processed": payroll_state.get('wage_types_processed', 0)
     }
+    payroll_state['_status_cache'] = (inputs, status)
+    return status